@@ -0,0 +1,68 @@
+import sys
+import os
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import random
+import string
+import time
+
+from list_based_impl import ListBasedList
+from src.unrolled_linked_impl import UnrolledLinkedList
+from src.rope_impl import RopeList
+from src.adaptive_impl import AdaptiveList
+
+SIZE = 200_000
+PHASE_OPS = 5_000
+CYCLES = 2
+
+def random_reads(instance, rng):
+    for _ in range(PHASE_OPS * 4):
+        instance.get(rng.randrange(instance.length()))
+
+def head_edits(instance, rng):
+    for _ in range(PHASE_OPS):
+        if rng.random() < 0.6:
+            instance.insert(rng.choice(string.ascii_letters), 0)
+        else:
+            instance.delete(0)
+
+def middle_edits(instance, rng):
+    for _ in range(PHASE_OPS):
+        index = rng.randrange(instance.length())
+        if rng.random() < 0.6:
+            instance.insert(rng.choice(string.ascii_letters), index)
+        else:
+            instance.delete(index)
+
+TRACES = {
+    "mixed": (random_reads, head_edits, random_reads, middle_edits),
+    "read_heavy": (random_reads, random_reads, random_reads, head_edits),
+}
+
+def run(list_type, text, phases):
+    instance = list_type(text)
+    rng = random.Random(2)
+    timings = {phase.__name__: 0.0 for phase in phases}
+    for _ in range(CYCLES):
+        for phase in phases:
+            start = time.perf_counter()
+            phase(instance, rng)
+            timings[phase.__name__] += time.perf_counter() - start
+    return timings, instance
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else SIZE
+    text = ''.join(random.Random(1).choices(string.ascii_letters, k=size))
+    for trace, phases in TRACES.items():
+        names = [phase.__name__ for phase in dict.fromkeys(phases)]
+        print(f"{trace:<20}" + ''.join(f"{name:>14}" for name in names) + f"{'total s':>10}")
+        for list_type in (ListBasedList, UnrolledLinkedList, RopeList, AdaptiveList):
+            timings, instance = run(list_type, text, phases)
+            note = f"  ({instance.migrations} migrations)" if isinstance(instance, AdaptiveList) else ''
+            print(f"  {list_type.__name__:<18}" + ''.join(f"{timings[name]:>14.3f}" for name in names)
+                  + f"{sum(timings.values()):>10.3f}{note}")
+
+if __name__ == "__main__":
+    main()
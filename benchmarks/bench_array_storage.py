@@ -0,0 +1,58 @@
+import sys
+import os
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import random
+import string
+import time
+import tracemalloc
+
+from list_based_impl import ListBasedList
+from src.array_based_impl import ArrayBasedList
+
+SIZE = 1_000_000
+OPERATIONS = 1_000
+
+def measure_memory(list_type, text):
+    tracemalloc.start()
+    instance = list_type(text)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return instance, current
+
+def measure_time(func, repeat=OPERATIONS):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+def run(list_type, text):
+    rng = random.Random(0)
+    instance, memory = measure_memory(list_type, text)
+    other = list_type(text[:1000])
+    results = {
+        "memory_bytes": memory,
+        "get": measure_time(lambda: instance.get(rng.randrange(instance.length()))),
+        "insert": measure_time(lambda: instance.insert('x', rng.randrange(instance.length()))),
+        "delete": measure_time(lambda: instance.delete(rng.randrange(instance.length()))),
+        "findFirst": measure_time(lambda: instance.findFirst('#'), repeat=10),
+        "clone": measure_time(instance.clone, repeat=10),
+        "extend": measure_time(lambda: instance.extend(other), repeat=100),
+        "reverse": measure_time(instance.reverse, repeat=10),
+    }
+    return results
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else SIZE
+    text = ''.join(random.Random(1).choices(string.ascii_letters, k=size))
+    baseline = run(ListBasedList, text)
+    packed = run(ArrayBasedList, text)
+    print(f"{'metric':<14}{'ListBasedList':>16}{'ArrayBasedList':>16}{'ratio':>10}")
+    for metric, value in baseline.items():
+        ratio = value / packed[metric] if packed[metric] else float('inf')
+        print(f"{metric:<14}{value:>16.6g}{packed[metric]:>16.6g}{ratio:>10.2f}")
+
+if __name__ == "__main__":
+    main()
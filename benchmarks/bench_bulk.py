@@ -0,0 +1,66 @@
+import sys
+import os
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import random
+import string
+import time
+
+from list_based_impl import ListBasedList
+from src.doubly_linked_impl import DoublyLinkedList
+
+SIZE = 1_000_000
+BATCH = 1_000
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def append_one_by_one(list_type, text):
+    instance = list_type()
+    for item in text:
+        instance.append(item)
+
+def insert_one_by_one(instance, index, text):
+    for offset, item in enumerate(text):
+        instance.insert(item, index + offset)
+
+def delete_one_by_one(instance, start, stop):
+    for _ in range(stop - start):
+        instance.delete(start)
+
+def run(list_type, text):
+    chunk = text[:BATCH]
+    middle = len(text) // 2
+    results = {
+        "load": (timed(lambda: append_one_by_one(list_type, text)), timed(lambda: list_type(text))),
+    }
+    per_element = list_type(text)
+    bulk = list_type(text)
+    results["extend_from_str"] = (
+        timed(lambda: [per_element.append(item) for item in chunk]),
+        timed(lambda: bulk.extend_from_str(chunk)),
+    )
+    results["insert_many"] = (
+        timed(lambda: insert_one_by_one(per_element, middle, chunk)),
+        timed(lambda: bulk.insert_many(middle, chunk)),
+    )
+    results["delete_range"] = (
+        timed(lambda: delete_one_by_one(per_element, middle, middle + BATCH)),
+        timed(lambda: bulk.delete_range(middle, middle + BATCH)),
+    )
+    return results
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else SIZE
+    text = ''.join(random.Random(1).choices(string.ascii_letters, k=size))
+    print(f"{'backend':<18}{'operation':<17}{'per-element s':>15}{'bulk s':>12}{'speedup':>10}")
+    for list_type in (ListBasedList, DoublyLinkedList):
+        for operation, (slow, fast) in run(list_type, text).items():
+            print(f"{list_type.__name__:<18}{operation:<17}{slow:>15.4f}{fast:>12.4f}{slow / fast:>10.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import sys
+import os
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import random
+import string
+import threading
+import time
+import warnings
+
+from common_definitions import CharacterWarning
+from list_based_impl import ListBasedList
+from src.doubly_linked_impl import DoublyLinkedList, Node, _new_node
+
+SIZE = 1_000_000
+WARNING_CALLS = 100_000
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def drain(read_fd):
+    while os.read(read_fd, 1 << 16):
+        pass
+
+def print_warnings(calls):
+    read_fd, write_fd = os.pipe()
+    reader = threading.Thread(target=drain, args=(read_fd,), daemon=True)
+    reader.start()
+    with open(write_fd, 'w', buffering=1) as sink:
+        for _ in range(calls):
+            print("Warning: findFirst received non-character element '12'. Returning -1.", file=sink)
+    reader.join()
+    os.close(read_fd)
+
+def rate_limited_warnings(instance, calls):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", CharacterWarning)
+        for _ in range(calls):
+            instance.findFirst(12)
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else SIZE
+    items = random.Random(1).choices(string.ascii_letters, k=size)
+    print(f"{'operation':<32}{'before s':>12}{'after s':>14}{'speedup':>10}")
+    rows = {
+        "ListBasedList(list)": (timed(lambda: ListBasedList(items)),
+                                timed(lambda: ListBasedList(items, validate=False))),
+        "DoublyLinkedList(list)": (timed(lambda: DoublyLinkedList(items)),
+                                   timed(lambda: DoublyLinkedList(items, validate=False))),
+        "node creation": (timed(lambda: [Node(item) for item in items]),
+                          timed(lambda: [_new_node(item) for item in items])),
+    }
+    calls = min(size, WARNING_CALLS)
+    rows[f"{calls} bad findFirst calls"] = (timed(lambda: print_warnings(calls)),
+                                            timed(lambda: rate_limited_warnings(ListBasedList('abc'), calls)))
+    for operation, (before, after) in rows.items():
+        print(f"{operation:<32}{before:>12.4f}{after:>14.4f}{before / after:>10.1f}")
+
+if __name__ == "__main__":
+    main()
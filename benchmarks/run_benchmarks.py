@@ -0,0 +1,325 @@
+import sys
+import os
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import argparse
+import json
+import platform
+import random
+import string
+import subprocess
+import time
+import tracemalloc
+
+from list_based_impl import ListBasedList
+from src.doubly_linked_impl import DoublyLinkedList
+from src.array_based_impl import ArrayBasedList
+from src.gap_buffer_impl import GapBufferList
+from src.rope_impl import RopeList
+from src.unrolled_linked_impl import UnrolledLinkedList
+from src.persistent_impl import PersistentList
+from src.concurrent_impl import ConcurrentList
+from src.mmap_impl import MappedList
+from src.adaptive_impl import AdaptiveList
+
+BACKENDS = {
+    "ListBasedList": ListBasedList,
+    "DoublyLinkedList": DoublyLinkedList,
+    "ArrayBasedList": ArrayBasedList,
+    "GapBufferList": GapBufferList,
+    "RopeList": RopeList,
+    "UnrolledLinkedList": UnrolledLinkedList,
+    "PersistentList": PersistentList,
+    "ConcurrentList": ConcurrentList,
+    "MappedList": MappedList,
+    "AdaptiveList": AdaptiveList,
+}
+
+DEFAULT_SIZES = [10, 1_000, 100_000]
+ALPHABET = string.ascii_letters
+
+def case_append(instance, rng, ops):
+    for _ in range(ops):
+        instance.append(rng.choice(ALPHABET))
+    return ops
+
+def case_random_insert(instance, rng, ops):
+    for _ in range(ops):
+        instance.insert(rng.choice(ALPHABET), rng.randint(0, instance.length()))
+    return ops
+
+def case_head_insert(instance, rng, ops):
+    for _ in range(ops):
+        instance.insert(rng.choice(ALPHABET), 0)
+    return ops
+
+def case_cursor_edit(instance, rng, ops):
+    position = instance.length() // 2
+    for _ in range(ops):
+        position = min(max(0, position + rng.randint(-4, 4)), instance.length())
+        if rng.random() < 0.5 or position == instance.length():
+            instance.insert(rng.choice(ALPHABET), position)
+        else:
+            instance.delete(position)
+    return ops
+
+def case_search(instance, rng, ops):
+    for _ in range(ops):
+        element = rng.choice(ALPHABET + '#')
+        instance.findFirst(element)
+        instance.findLast(element)
+    return ops
+
+def case_get(instance, rng, ops):
+    count = ops if instance.length() else 0
+    for _ in range(count):
+        instance.get(rng.randrange(instance.length()))
+    return count
+
+def case_sequential_get(instance, rng, ops):
+    count = min(ops, instance.length())
+    for index in range(count):
+        instance.get(index)
+    return count
+
+def case_insert_middle(instance, rng, ops):
+    for _ in range(ops):
+        instance.insert('m', instance.length() // 2)
+    return ops
+
+def case_delete(instance, rng, ops):
+    count = max(0, min(ops, instance.length() - 1))
+    for _ in range(count):
+        instance.delete(rng.randrange(instance.length()))
+    return count
+
+def case_delete_all(instance, rng, ops):
+    for _ in range(ops):
+        instance.deleteAll(rng.choice(ALPHABET))
+    return ops
+
+def case_length(instance, rng, ops):
+    for _ in range(ops):
+        instance.length()
+    return ops
+
+def case_clone(instance, rng, ops):
+    for _ in range(ops):
+        instance.clone()
+    return ops
+
+def case_reverse(instance, rng, ops):
+    for _ in range(ops):
+        instance.reverse()
+    return ops
+
+def case_extend(instance, rng, ops):
+    other = instance.__class__(ALPHABET)
+    for _ in range(ops):
+        instance.extend(other)
+    return ops
+
+def case_str(instance, rng, ops):
+    for _ in range(ops):
+        str(instance)
+    return ops
+
+def case_clear(instance, rng, ops):
+    for _ in range(ops):
+        instance.clear()
+    return ops
+
+def case_extend_from_str(instance, rng, ops):
+    for _ in range(ops):
+        instance.extend_from_str(ALPHABET)
+    return ops
+
+def case_insert_many(instance, rng, ops):
+    for _ in range(ops):
+        instance.insert_many(rng.randint(0, instance.length()), ALPHABET)
+    return ops
+
+def case_delete_range(instance, rng, ops):
+    count = min(ops, instance.length() // 8)
+    for _ in range(count):
+        start = rng.randint(0, instance.length() - 8)
+        instance.delete_range(start, start + 8)
+    return count
+
+def case_splice(instance, rng, ops):
+    donor = instance.__class__(ALPHABET)
+    for _ in range(ops):
+        instance.splice(donor)
+        donor = instance.split_at(instance.length() - len(ALPHABET))
+    return ops
+
+def case_split_at(instance, rng, ops):
+    for _ in range(ops):
+        instance.splice(instance.split_at(rng.randint(0, instance.length())))
+    return ops
+
+def case_cursor(instance, rng, ops):
+    cursor = instance.cursor(instance.length() // 2)
+    for _ in range(ops):
+        choice = rng.random()
+        if choice < 0.4 or cursor.at_end():
+            cursor.insert_here(rng.choice(ALPHABET))
+        elif choice < 0.6:
+            cursor.delete_here()
+        elif choice < 0.8:
+            cursor.next()
+        elif cursor.index:
+            cursor.prev()
+    return ops
+
+def case_batch(instance, rng, ops):
+    with instance.batch() as batch:
+        for _ in range(ops):
+            if rng.random() < 0.7 or not batch.length():
+                batch.insert(rng.choice(ALPHABET), rng.randint(0, batch.length()))
+            else:
+                batch.delete(rng.randrange(batch.length()))
+    return ops
+
+def case_slice(instance, rng, ops):
+    for _ in range(ops):
+        start = rng.randint(0, instance.length())
+        instance[start:start + 64]
+    return ops
+
+def case_iterate(instance, rng, ops):
+    for _ in range(ops):
+        for _ in instance:
+            pass
+    return ops
+
+def case_to_str(instance, rng, ops):
+    for _ in range(ops):
+        instance.to_str()
+    return ops
+
+CASES = {
+    "append_only": (case_append, 1.0, None),
+    "random_insert": (case_random_insert, 1.0, None),
+    "head_insert": (case_head_insert, 1.0, None),
+    "cursor_edit": (case_cursor_edit, 1.0, None),
+    "search_heavy": (case_search, 0.1, None),
+    "get": (case_get, 1.0, None),
+    "sequential_get": (case_sequential_get, 1.0, None),
+    "insert_middle": (case_insert_middle, 1.0, None),
+    "delete": (case_delete, 1.0, None),
+    "deleteAll": (case_delete_all, 0.01, None),
+    "length": (case_length, 1.0, None),
+    "clone": (case_clone, 0.01, None),
+    "reverse": (case_reverse, 0.01, None),
+    "extend": (case_extend, 0.1, None),
+    "str": (case_str, 0.01, None),
+    "clear": (case_clear, 0.01, None),
+    "extend_from_str": (case_extend_from_str, 0.1, "extend_from_str"),
+    "insert_many": (case_insert_many, 0.1, "insert_many"),
+    "delete_range": (case_delete_range, 0.1, "delete_range"),
+    "splice": (case_splice, 1.0, "splice"),
+    "split_at": (case_split_at, 0.1, "split_at"),
+    "cursor": (case_cursor, 1.0, "cursor"),
+    "batch": (case_batch, 1.0, "batch"),
+    "slice": (case_slice, 1.0, "__getitem__"),
+    "iterate": (case_iterate, 0.01, "__iter__"),
+    "to_str": (case_to_str, 0.01, "to_str"),
+}
+
+def supports(list_type, case):
+    required = CASES[case][2]
+    return required is None or hasattr(list_type, required)
+
+def run_case(list_type, text, case, ops, track_memory):
+    func = CASES[case][0]
+    rng = random.Random(case)
+    if track_memory:
+        tracemalloc.start()
+    instance = list_type(text)
+    if track_memory:
+        tracemalloc.reset_peak()
+    start = time.perf_counter()
+    count = func(instance, rng, ops)
+    elapsed = time.perf_counter() - start
+    peak = None
+    if track_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {"ops": count, "seconds": elapsed, "seconds_per_op": elapsed / count if count else None,
+            "peak_bytes": peak}
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=project_root, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(backends, sizes, cases, ops, track_memory, max_list_ops):
+    results = []
+    for size in sizes:
+        text = ''.join(random.Random(size).choices(ALPHABET, k=size))
+        for name in backends:
+            for case in cases:
+                if not supports(BACKENDS[name], case):
+                    continue
+                scale = CASES[case][1]
+                case_ops = max(1, int(ops * scale))
+                if size * case_ops > max_list_ops and scale < 1.0:
+                    case_ops = max(1, max_list_ops // max(size, 1))
+                measurement = run_case(BACKENDS[name], text, case, case_ops, track_memory)
+                results.append({"backend": name, "size": size, "case": case, **measurement})
+                per_op = measurement["seconds_per_op"]
+                print(f"{name:<20}{size:>10}  {case:<16}"
+                      + (f"{per_op * 1e6:>14.2f} us/op" if per_op is not None else f"{'n/a':>20}")
+                      + (f"{measurement['peak_bytes']:>14} B peak" if track_memory else ""))
+    return results
+
+def compare(results, baseline_path, threshold):
+    with open(baseline_path) as baseline_file:
+        baseline = {(row["backend"], row["size"], row["case"]): row for row in json.load(baseline_file)["results"]}
+    regressions = 0
+    for row in results:
+        previous = baseline.get((row["backend"], row["size"], row["case"]))
+        if not previous or row["seconds_per_op"] is None or previous["seconds_per_op"] is None:
+            continue
+        ratio = row["seconds_per_op"] / previous["seconds_per_op"] if previous["seconds_per_op"] else 1.0
+        if ratio > threshold:
+            regressions += 1
+            print(f"REGRESSION {row['backend']} size={row['size']} {row['case']}: {ratio:.2f}x slower")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the character list implementations.")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--cases", nargs="+", default=list(CASES), choices=list(CASES))
+    parser.add_argument("--ops", type=int, default=1_000)
+    parser.add_argument("--max-list-ops", type=int, default=10_000_000,
+                        help="cap on ops * size for whole-list operations such as clone and reverse")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc peak memory tracking")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", help="baseline JSON file to diff against")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    results = run(args.backends, args.sizes, args.cases, args.ops, not args.no_memory, args.max_list_ops)
+    report = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "results": results,
+    }
+    with open(args.output, "w") as output_file:
+        json.dump(report, output_file, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,10 @@
+import sys
+import time
+import warnings
+
 Character = str
+WARNING_INTERVAL = 1.0
+_last_warnings: dict = {}
 
 class InvalidIndexError(Exception):
     pass
@@ -6,5 +12,32 @@ class InvalidIndexError(Exception):
 class CharacterTypeError(Exception):
     pass
 
+class CharacterWarning(UserWarning):
+    pass
+
 def is_character(element) -> bool:
-    return isinstance(element, str) and len(element) == 1
\ No newline at end of file
+    return isinstance(element, str) and len(element) == 1
+
+def to_characters(data, validate: bool = True, encoding: str = 'utf-8') -> list[Character]:
+    if isinstance(data, str):
+        return list(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return list(bytes(data).decode(encoding))
+    items = list(data)
+    if validate and not all(map(is_character, items)):
+        invalid = next(item for item in items if not is_character(item))
+        raise CharacterTypeError(f"Data must contain only characters. Found: {invalid}")
+    return items
+
+def warn_non_character(method: str, element, outcome: str) -> None:
+    now = time.monotonic()
+    caller = sys._getframe(2)
+    key = (method, caller.f_code.co_filename, caller.f_lineno)
+    last, suppressed = _last_warnings.get(key, (None, 0))
+    if last is not None and now - last < WARNING_INTERVAL:
+        _last_warnings[key] = (last, suppressed + 1)
+        return
+    _last_warnings[key] = (now, 0)
+    note = f" ({suppressed} similar warnings suppressed)" if suppressed else ''
+    warnings.warn(f"{method} received non-character element '{element}'. {outcome}{note}", CharacterWarning,
+                  stacklevel=3)
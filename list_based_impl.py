@@ -1,82 +1,301 @@
-from common_definitions import Character, InvalidIndexError, CharacterTypeError, is_character
-import sys
+from common_definitions import Character, InvalidIndexError, CharacterTypeError, is_character, to_characters, warn_non_character
+from src.char_index import CharacterIndex
+from src.batch import Batch
+from src.sharing import share, detach
+from src import streaming, serialization, parallel
+import weakref
+from typing import Optional
+
 
 class ListBasedList:
-    def __init__(self, initial_data=None):
-        self._data: list[Character] = []
-        if initial_data:
-            for item in initial_data:
-                if is_character(item):
-                    self._data.append(item)
-                else:
-                    raise CharacterTypeError(f"Initial data must contain only characters. Found: {item}")
+    def __init__(self, initial_data=None, indexed: bool = False, validate: bool = True):
+        self._data: list[Character] = to_characters(initial_data, validate) if initial_data else []
+        self._index: CharacterIndex | None = CharacterIndex() if indexed else None
+        self._sharers: list[int] = [1]
+        self._release: Optional[weakref.finalize] = None
+        self._reversed: bool = False
+        self._version: int = 0
 
     def __str__(self) -> str:
-        return f"[{', '.join(repr(item) for item in self._data)}]"
+        return f"[{', '.join(repr(item) for item in self)}]"
 
     def __repr__(self) -> str:
-        return f"ListBasedList({self._data!r})"
+        return f"ListBasedList({self._logical_data()!r})"
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self):
+        return reversed(self._data) if self._reversed else iter(self._data)
+
+    def __reversed__(self):
+        return iter(self._data) if self._reversed else reversed(self._data)
+
+    def __contains__(self, element) -> bool:
+        if not is_character(element):
+            return False
+        if self._index is not None:
+            return element in self._fresh_index()
+        return element in self._data
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            new_list = ListBasedList(indexed=self._index is not None)
+            new_list._data = self._logical_data()[key]
+            return new_list
+        if key < 0:
+            key += len(self._data)
+        return self.get(key)
+
+    def to_str(self, start: int = 0, stop: Optional[int] = None) -> str:
+        return ''.join(self._logical_data()[start:stop])
 
     def length(self) -> int:
         return len(self._data)
 
+    def set_indexed(self, enabled: bool) -> None:
+        if not enabled:
+            self._index = None
+        elif self._index is None:
+            self._index = CharacterIndex()
+
+    def _detach(self) -> None:
+        detach(self)
+
+    def _ensure_owned(self) -> None:
+        if self._sharers[0] > 1:
+            data = self._data[:]
+            self._detach()
+            self._data = data
+
+    def _logical_data(self) -> list[Character]:
+        return self._data[::-1] if self._reversed else self._data
+
+    def _physical(self, index: int) -> int:
+        return len(self._data) - 1 - index if self._reversed else index
+
+    def _materialize(self) -> None:
+        if not self._reversed:
+            return
+        self._ensure_owned()
+        self._data.reverse()
+        self._reversed = False
+        if self._index is not None:
+            self._index.reverse(len(self._data))
+
+    def _fresh_index(self) -> CharacterIndex:
+        if self._index.stale:
+            self._index.rebuild(self._data)
+        return self._index
+
     def append(self, element: Character) -> None:
         if not is_character(element):
             raise CharacterTypeError(f"Can only append a single character string. Got: {element}")
+        self._version += 1
+        self._materialize()
+        self._ensure_owned()
         self._data.append(element)
+        if self._index is not None:
+            self._index.append(element, len(self._data) - 1)
 
     def insert(self, element: Character, index: int) -> None:
         if not is_character(element):
             raise CharacterTypeError(f"Can only insert a single character string. Got: {element}")
         if not (0 <= index <= self.length()):
              raise InvalidIndexError(f"Index {index} is out of bounds for insertion (0 to {self.length()})")
-        self._data.insert(index, element)
+        self._version += 1
+        self._ensure_owned()
+        physical = len(self._data) - index if self._reversed else index
+        self._data.insert(physical, element)
+        if self._index is not None:
+            self._index.insert(element, physical)
 
     def delete(self, index: int) -> Character:
         if not (0 <= index < self.length()):
             raise InvalidIndexError(f"Index {index} is out of bounds for deletion (0 to {self.length() - 1})")
-        return self._data.pop(index)
+        self._version += 1
+        self._ensure_owned()
+        physical = self._physical(index)
+        data = self._data.pop(physical)
+        if self._index is not None:
+            self._index.delete(data, physical)
+        return data
 
     def deleteAll(self, element: Character) -> None:
         if not is_character(element):
-             print(f"Warning: deleteAll received non-character element '{element}'. No elements will be deleted.", file=sys.stderr)
+             warn_non_character('deleteAll', element, "No elements will be deleted.")
              return
-        self._data = [item for item in self._data if item != element]
+        self._version += 1
+        if self._index is None:
+            data = [item for item in self._data if item != element]
+            self._detach()
+            self._data = data
+            return
+        if element not in self._fresh_index():
+            return
+        data = [item for item in self._data if item != element]
+        self._detach()
+        self._data = data
+        self._index.remove_all(element)
 
     def get(self, index: int) -> Character:
         if not (0 <= index < self.length()):
             raise InvalidIndexError(f"Index {index} is out of bounds (0 to {self.length() - 1})")
-        return self._data[index]
+        return self._data[self._physical(index)]
 
     def clone(self) -> 'ListBasedList':
-        return ListBasedList(self._data[:])
+        new_list = ListBasedList(indexed=self._index is not None)
+        new_list._data = self._data
+        share(self, new_list)
+        new_list._reversed = self._reversed
+        return new_list
 
     def reverse(self) -> None:
-        self._data.reverse()
+        self._version += 1
+        self._reversed = not self._reversed
 
     def findFirst(self, element: Character) -> int:
         if not is_character(element):
-             print(f"Warning: findFirst received non-character element '{element}'. Returning -1.", file=sys.stderr)
+             warn_non_character('findFirst', element, "Returning -1.")
+             return -1
+        if self._reversed:
+            position = self._find_last_physical(element)
+        else:
+            position = self._find_first_physical(element)
+        return self._physical(position) if position != -1 else -1
+
+    def findLast(self, element: Character) -> int:
+        if not is_character(element):
+             warn_non_character('findLast', element, "Returning -1.")
              return -1
+        if self._reversed:
+            position = self._find_first_physical(element)
+        else:
+            position = self._find_last_physical(element)
+        return self._physical(position) if position != -1 else -1
+
+    def _find_first_physical(self, element: Character) -> int:
+        if self._index is not None:
+            return self._fresh_index().first(element)
         try:
             return self._data.index(element)
         except ValueError:
             return -1
 
-    def findLast(self, element: Character) -> int:
-        if not is_character(element):
-             print(f"Warning: findLast received non-character element '{element}'. Returning -1.", file=sys.stderr)
-             return -1
+    def _find_last_physical(self, element: Character) -> int:
+        if self._index is not None:
+            return self._fresh_index().last(element)
         for i in range(self.length() - 1, -1, -1):
             if self._data[i] == element:
                 return i
         return -1
 
     def clear(self) -> None:
+        self._version += 1
+        self._detach()
         self._data = []
+        self._reversed = False
+        if self._index is not None:
+            self._index.clear()
 
     def extend(self, elements: 'ListBasedList') -> None:
         if not isinstance(elements, ListBasedList):
              raise TypeError("Can only extend with another ListBasedList instance.")
-        for item in elements._data:
-            self.append(item)
\ No newline at end of file
+        self._version += 1
+        items = elements._logical_data()
+        self._materialize()
+        self._ensure_owned()
+        start = len(self._data)
+        self._data.extend(items)
+        if self._index is not None:
+            self._index.extend(self._data[start:], start)
+
+    def extend_from_str(self, text: str) -> None:
+        if not isinstance(text, str):
+            raise TypeError("Can only extend from a str instance.")
+        self._version += 1
+        self._materialize()
+        self._ensure_owned()
+        start = len(self._data)
+        self._data.extend(text)
+        if self._index is not None:
+            self._index.extend(text, start)
+
+    def insert_many(self, index: int, elements) -> None:
+        items = to_characters(elements)
+        if not (0 <= index <= self.length()):
+            raise InvalidIndexError(f"Index {index} is out of bounds for insertion (0 to {self.length()})")
+        self._version += 1
+        self._materialize()
+        self._ensure_owned()
+        self._data[index:index] = items
+        if self._index is not None:
+            self._index.extend(items, index)
+
+    def delete_range(self, start: int, stop: int) -> None:
+        if not (0 <= start <= stop <= self.length()):
+            raise InvalidIndexError(f"Range {start}:{stop} is out of bounds for deletion (0 to {self.length()})")
+        self._version += 1
+        self._materialize()
+        self._ensure_owned()
+        del self._data[start:stop]
+        if self._index is not None:
+            self._index.delete_range(start, stop)
+
+    def batch(self) -> Batch:
+        return Batch(self)
+
+    async def extend_from_stream(self, reader, chunk_size: int = streaming.DEFAULT_CHUNK_SIZE,
+                                 encoding: str = 'utf-8') -> int:
+        return await streaming.extend_from_stream(self, reader, chunk_size, encoding)
+
+    def iter_chunks(self, chunk_size: int = streaming.DEFAULT_CHUNK_SIZE):
+        return streaming.iter_chunks(self, chunk_size)
+
+    async def write_to_stream(self, writer, chunk_size: int = streaming.DEFAULT_CHUNK_SIZE,
+                              encoding: str = 'utf-8') -> int:
+        return await streaming.write_to_stream(self, writer, chunk_size, encoding)
+
+    def save(self, destination, encoding: str = 'utf-32', compression: Optional[str] = None) -> None:
+        serialization.save_to(self, destination, encoding, compression)
+
+    @classmethod
+    def load(cls, source) -> 'ListBasedList':
+        return serialization.load_from(cls(), source)
+
+    def to_bytes(self, encoding: str = 'utf-32', compression: Optional[str] = None) -> bytes:
+        return serialization.to_bytes(self, encoding, compression)
+
+    @classmethod
+    def from_bytes(cls, data) -> 'ListBasedList':
+        return serialization.from_bytes(cls(), data)
+
+    def find(self, pattern: str, workers: Optional[int] = None) -> int:
+        return parallel.find(self, pattern, workers)
+
+    def rfind(self, pattern: str, workers: Optional[int] = None) -> int:
+        return parallel.rfind(self, pattern, workers)
+
+    def find_all(self, pattern: str, workers: Optional[int] = None) -> list[int]:
+        return parallel.find_all(self, pattern, workers)
+
+    def count(self, pattern: str, workers: Optional[int] = None) -> int:
+        return parallel.count(self, pattern, workers)
+
+    def delete_all_of(self, characters, workers: Optional[int] = None) -> int:
+        return parallel.delete_all_of(self, characters, workers)
+
+    def _apply_pieces(self, pieces: list) -> None:
+        source = self._logical_data()
+        data: list[Character] = []
+        for piece in pieces:
+            if piece[0] == 'o':
+                data += source[piece[1]:piece[2]]
+            else:
+                data += piece[1]
+        self._version += 1
+        self._detach()
+        self._data = data
+        self._reversed = False
+        if self._index is not None:
+            self._index.invalidate()
@@ -0,0 +1,228 @@
+from common_definitions import Character, is_character, to_characters, warn_non_character
+from list_based_impl import ListBasedList
+from src.unrolled_linked_impl import UnrolledLinkedList
+from src.rope_impl import RopeList
+from math import log2
+
+WINDOW = 128
+SWITCH_MARGIN = 0.25
+SMALL_SIZE = 8192
+MIGRATION_COSTS = {'array': 0.03, 'chunked': 0.12, 'tree': 0.05}
+ARRAY_COSTS = {'get': 0.6, 'edit': 0.3, 'append': 0.3, 'shift': 5e-4,
+               'scan': 0.025, 'filter': 0.026, 'reverse': 0.0, 'extend': 0.004}
+CHUNKED_COSTS = {'get': 0.5, 'edit': 1.0, 'append': 0.4, 'walk': 1e-3,
+                 'scan': 0.018, 'filter': 0.074, 'reverse': 0.003, 'extend': 0.055}
+TREE_COSTS = {'get': 0.5, 'edit': 4.0, 'append': 0.8, 'depth_get': 0.075, 'depth_edit': 1.6, 'depth_base': -12.0,
+              'scan': 0.0013, 'filter': 0.007, 'reverse': 0.008, 'extend': 0.006}
+REPRESENTATIONS = {'array': ListBasedList, 'chunked': UnrolledLinkedList, 'tree': RopeList}
+
+def _build(representation: str, text: str):
+    inner = REPRESENTATIONS[representation]()
+    inner.extend_from_str(text)
+    return inner
+
+class AdaptiveList:
+    def __init__(self, initial_data=None, representation: str = 'array'):
+        if representation not in REPRESENTATIONS:
+            raise ValueError(f"Unknown representation {representation!r}. Expected one of: {', '.join(REPRESENTATIONS)}")
+        text = initial_data if isinstance(initial_data, str) else ''.join(to_characters(initial_data or ''))
+        self._representation: str = representation
+        self._list = _build(representation, text)
+        self._regret: dict = dict.fromkeys(REPRESENTATIONS, 0.0)
+        self._migrations: int = 0
+        self._reset_window()
+        self._update_tracking()
+
+    def __str__(self) -> str:
+        return str(self._list)
+
+    def __repr__(self) -> str:
+        return f"AdaptiveList(representation={self._representation!r}, length={self.length()})"
+
+    def __len__(self) -> int:
+        return self._list.length()
+
+    def __iter__(self):
+        return iter(self.to_str())
+
+    def __contains__(self, element) -> bool:
+        return is_character(element) and self._list.findFirst(element) != -1
+
+    @property
+    def representation(self) -> str:
+        return self._representation
+
+    @property
+    def migrations(self) -> int:
+        return self._migrations
+
+    def _reset_window(self) -> None:
+        self._ops: int = 0
+        self._gets: int = 0
+        self._get_walk: int = 0
+        self._edits: int = 0
+        self._edit_walk: int = 0
+        self._edit_shift: int = 0
+        self._appends: int = 0
+        self._scanned: int = 0
+        self._filtered: int = 0
+        self._reversed: int = 0
+        self._extended: int = 0
+
+    def _update_tracking(self) -> None:
+        self._tracking: bool = self._representation != 'array' or self._list.length() >= SMALL_SIZE
+
+    def _bulk_cost(self, costs: dict) -> float:
+        return (self._scanned * costs['scan'] + self._filtered * costs['filter']
+                + self._reversed * costs['reverse'] + self._extended * costs['extend'])
+
+    def _window_costs(self, length: int) -> dict:
+        depth = log2(max(2, length))
+        tree_get = TREE_COSTS['get'] + TREE_COSTS['depth_get'] * depth
+        tree_edit = max(TREE_COSTS['edit'], TREE_COSTS['depth_edit'] * depth + TREE_COSTS['depth_base'])
+        return {
+            'array': (self._gets * ARRAY_COSTS['get'] + self._edits * ARRAY_COSTS['edit']
+                      + self._edit_shift * ARRAY_COSTS['shift'] + self._appends * ARRAY_COSTS['append']
+                      + self._bulk_cost(ARRAY_COSTS)),
+            'chunked': (self._gets * CHUNKED_COSTS['get'] + self._edits * CHUNKED_COSTS['edit']
+                        + (self._get_walk + self._edit_walk) * CHUNKED_COSTS['walk']
+                        + self._appends * CHUNKED_COSTS['append'] + self._bulk_cost(CHUNKED_COSTS)),
+            'tree': (self._gets * tree_get + self._edits * tree_edit + self._appends * TREE_COSTS['append'] * tree_edit
+                     + self._bulk_cost(TREE_COSTS)),
+        }
+
+    def _rebalance(self) -> None:
+        length = self._list.length()
+        costs = self._window_costs(length)
+        self._reset_window()
+        current = costs[self._representation]
+        ready = []
+        for representation, cost in costs.items():
+            if cost > current * (1 - SWITCH_MARGIN) or (length < SMALL_SIZE and representation != 'array'):
+                self._regret[representation] = 0.0
+                continue
+            self._regret[representation] += current - cost
+            if self._regret[representation] >= length * MIGRATION_COSTS[representation]:
+                ready.append(representation)
+        if ready:
+            self.migrate(min(ready, key=costs.get))
+        self._update_tracking()
+
+    def _record(self) -> None:
+        self._ops += 1
+        if self._ops >= WINDOW:
+            self._rebalance()
+
+    def _record_index(self, index: int, length: int, edit: bool) -> None:
+        walk = min(index, length - index)
+        if edit:
+            self._edits += 1
+            self._edit_walk += walk
+            self._edit_shift += length - index
+        else:
+            self._gets += 1
+            self._get_walk += walk
+        self._record()
+
+    def _record_scan(self, scanned: int) -> None:
+        if self._tracking:
+            self._scanned += scanned
+            self._record()
+
+    def migrate(self, representation: str) -> None:
+        if representation not in REPRESENTATIONS:
+            raise ValueError(f"Unknown representation {representation!r}. Expected one of: {', '.join(REPRESENTATIONS)}")
+        if representation == self._representation:
+            return
+        self._list = _build(representation, self.to_str())
+        self._representation = representation
+        self._regret = dict.fromkeys(REPRESENTATIONS, 0.0)
+        self._migrations += 1
+        self._update_tracking()
+
+    def to_str(self) -> str:
+        return self._list.to_str()
+
+    def length(self) -> int:
+        return self._list.length()
+
+    def append(self, element: Character) -> None:
+        self._list.append(element)
+        self._appends += 1
+        self._record()
+
+    def insert(self, element: Character, index: int) -> None:
+        length = self._list.length()
+        self._list.insert(element, index)
+        if index == length:
+            self._appends += 1
+            self._record()
+        elif self._tracking:
+            self._record_index(index, length, True)
+        else:
+            self._record()
+
+    def delete(self, index: int) -> Character:
+        length = self._list.length()
+        data = self._list.delete(index)
+        if self._tracking:
+            self._record_index(index, length, True)
+        else:
+            self._record()
+        return data
+
+    def deleteAll(self, element: Character) -> None:
+        if not is_character(element):
+            warn_non_character('deleteAll', element, "No elements will be deleted.")
+            return
+        self._filtered += self._list.length()
+        self._list.deleteAll(element)
+        self._record()
+
+    def get(self, index: int) -> Character:
+        data = self._list.get(index)
+        if self._tracking:
+            self._record_index(index, self._list.length(), False)
+        return data
+
+    def findFirst(self, element: Character) -> int:
+        if not is_character(element):
+            warn_non_character('findFirst', element, "Returning -1.")
+            return -1
+        position = self._list.findFirst(element)
+        self._record_scan(position + 1 if position != -1 else self._list.length())
+        return position
+
+    def findLast(self, element: Character) -> int:
+        if not is_character(element):
+            warn_non_character('findLast', element, "Returning -1.")
+            return -1
+        position = self._list.findLast(element)
+        self._record_scan(self._list.length() - position if position != -1 else self._list.length())
+        return position
+
+    def clone(self) -> 'AdaptiveList':
+        new_list = AdaptiveList(representation=self._representation)
+        new_list._list = self._list.clone()
+        new_list._update_tracking()
+        return new_list
+
+    def reverse(self) -> None:
+        self._list.reverse()
+        self._reversed += self._list.length()
+        self._record()
+
+    def clear(self) -> None:
+        self._list.clear()
+
+    def extend(self, elements: 'AdaptiveList') -> None:
+        if not isinstance(elements, AdaptiveList):
+            raise TypeError("Can only extend with another AdaptiveList instance.")
+        self.extend_from_str(elements.to_str())
+
+    def extend_from_str(self, text: str) -> None:
+        if not isinstance(text, str):
+            raise TypeError("Can only extend from a str instance.")
+        self._list.extend_from_str(text)
+        self._extended += len(text)
+        self._record()
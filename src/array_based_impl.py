@@ -0,0 +1,112 @@
+from common_definitions import Character, InvalidIndexError, CharacterTypeError, is_character, warn_non_character
+from array import array
+import sys
+
+_TYPECODE = next(code for code in 'IL' if array(code).itemsize == 4)
+_ENCODING = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
+_ERRORS = 'surrogatepass'
+SEARCH_CHUNK = 1 << 16
+
+def _pack(text: str) -> array:
+    return array(_TYPECODE, text.encode(_ENCODING, _ERRORS))
+
+class ArrayBasedList:
+    def __init__(self, initial_data=None):
+        self._data: array = array(_TYPECODE)
+        if initial_data:
+            if isinstance(initial_data, str):
+                self._data = _pack(initial_data)
+                return
+            items = list(initial_data)
+            for item in items:
+                if not is_character(item):
+                    raise CharacterTypeError(f"Initial data must contain only characters. Found: {item}")
+            self._data = _pack(''.join(items))
+
+    def __str__(self) -> str:
+        return f"[{', '.join(repr(item) for item in self._text())}]"
+
+    def __repr__(self) -> str:
+        return f"ArrayBasedList({self._text()!r})"
+
+    def _text(self) -> str:
+        return self._data.tobytes().decode(_ENCODING, _ERRORS)
+
+    def length(self) -> int:
+        return len(self._data)
+
+    def append(self, element: Character) -> None:
+        if not is_character(element):
+            raise CharacterTypeError(f"Can only append a single character string. Got: {element}")
+        self._data.append(ord(element))
+
+    def insert(self, element: Character, index: int) -> None:
+        if not is_character(element):
+            raise CharacterTypeError(f"Can only insert a single character string. Got: {element}")
+        if not (0 <= index <= self.length()):
+            raise InvalidIndexError(f"Index {index} is out of bounds for insertion (0 to {self.length()})")
+        self._data.insert(index, ord(element))
+
+    def delete(self, index: int) -> Character:
+        if not (0 <= index < self.length()):
+            raise InvalidIndexError(f"Index {index} is out of bounds for deletion (0 to {self.length() - 1})")
+        return chr(self._data.pop(index))
+
+    def deleteAll(self, element: Character) -> None:
+        if not is_character(element):
+            warn_non_character('deleteAll', element, "No elements will be deleted.")
+            return
+        data = self._data
+        if ord(element) not in data:
+            return
+        remaining = array(_TYPECODE)
+        for start in range(0, len(data), SEARCH_CHUNK):
+            text = data[start:start + SEARCH_CHUNK].tobytes().decode(_ENCODING, _ERRORS)
+            remaining.frombytes(text.replace(element, '').encode(_ENCODING, _ERRORS))
+        self._data = remaining
+
+    def get(self, index: int) -> Character:
+        if not (0 <= index < self.length()):
+            raise InvalidIndexError(f"Index {index} is out of bounds (0 to {self.length() - 1})")
+        return chr(self._data[index])
+
+    def clone(self) -> 'ArrayBasedList':
+        new_list = ArrayBasedList()
+        new_list._data = self._data[:]
+        return new_list
+
+    def reverse(self) -> None:
+        self._data.reverse()
+
+    def findFirst(self, element: Character) -> int:
+        if not is_character(element):
+            warn_non_character('findFirst', element, "Returning -1.")
+            return -1
+        try:
+            return self._data.index(ord(element))
+        except ValueError:
+            return -1
+
+    def findLast(self, element: Character) -> int:
+        if not is_character(element):
+            warn_non_character('findLast', element, "Returning -1.")
+            return -1
+        code = ord(element)
+        stop = len(self._data)
+        while stop > 0:
+            start = max(0, stop - SEARCH_CHUNK)
+            chunk = self._data[start:stop]
+            chunk.reverse()
+            try:
+                return stop - 1 - chunk.index(code)
+            except ValueError:
+                stop = start
+        return -1
+
+    def clear(self) -> None:
+        self._data = array(_TYPECODE)
+
+    def extend(self, elements: 'ArrayBasedList') -> None:
+        if not isinstance(elements, ArrayBasedList):
+            raise TypeError("Can only extend with another ArrayBasedList instance.")
+        self._data.extend(elements._data)
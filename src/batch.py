@@ -0,0 +1,128 @@
+from common_definitions import Character, InvalidIndexError, CharacterTypeError, is_character
+from bisect import bisect_right
+from itertools import accumulate, islice
+
+class Batch:
+    def __init__(self, owner):
+        self._list = owner
+        self._base_length: int = owner.length()
+        self._base_version: int = owner._version
+        self._pieces: list = [('o', 0, self._base_length)] if self._base_length else []
+        self._sizes: list[int] = [self._base_length] if self._base_length else []
+        self._ends: list[int] = self._sizes[:]
+        self._clean: int = len(self._sizes)
+        self._length: int = self._base_length
+        self._closed: bool = False
+
+    def __repr__(self) -> str:
+        return f"Batch(length={self._length}, pieces={len(self._pieces)}, closed={self._closed})"
+
+    def __enter__(self) -> 'Batch':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+    def length(self) -> int:
+        return self._length
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("Batch has already been committed or rolled back.")
+
+    def _touch(self, position: int) -> None:
+        self._clean = min(self._clean, position)
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        ends = self._ends
+        clean = self._clean
+        if clean < len(self._sizes) or len(ends) != len(self._sizes):
+            total = ends[clean - 1] if clean else 0
+            ends[clean:] = islice(accumulate(self._sizes[clean:], initial=total), 1, None)
+            self._clean = len(self._sizes)
+        position = bisect_right(ends, index)
+        if position == len(ends):
+            return position, 0
+        return position, index - (ends[position - 1] if position else 0)
+
+    def get(self, index: int) -> Character:
+        self._check_open()
+        if not (0 <= index < self._length):
+            raise InvalidIndexError(f"Index {index} is out of bounds (0 to {self._length - 1})")
+        position, offset = self._locate(index)
+        piece = self._pieces[position]
+        if piece[0] == 'o':
+            return self._list.get(piece[1] + offset)
+        return piece[1][offset]
+
+    def append(self, element: Character) -> None:
+        self.insert(element, self._length)
+
+    def insert(self, element: Character, index: int) -> None:
+        self._check_open()
+        if not is_character(element):
+            raise CharacterTypeError(f"Can only insert a single character string. Got: {element}")
+        if not (0 <= index <= self._length):
+            raise InvalidIndexError(f"Index {index} is out of bounds for insertion (0 to {self._length})")
+        position, offset = self._locate(index)
+        pieces = self._pieces
+        sizes = self._sizes
+        if offset == 0 and position > 0 and pieces[position - 1][0] == 'n':
+            pieces[position - 1][1].append(element)
+            sizes[position - 1] += 1
+            position -= 1
+        elif position < len(pieces) and pieces[position][0] == 'n':
+            pieces[position][1].insert(offset, element)
+            sizes[position] += 1
+        elif offset == 0:
+            pieces.insert(position, ('n', [element]))
+            sizes.insert(position, 1)
+        else:
+            _, start, stop = pieces[position]
+            pieces[position:position + 1] = [('o', start, start + offset), ('n', [element]),
+                                             ('o', start + offset, stop)]
+            sizes[position:position + 1] = [offset, 1, stop - start - offset]
+        self._touch(position)
+        self._length += 1
+
+    def delete(self, index: int) -> Character:
+        self._check_open()
+        if not (0 <= index < self._length):
+            raise InvalidIndexError(f"Index {index} is out of bounds for deletion (0 to {self._length - 1})")
+        position, offset = self._locate(index)
+        piece = self._pieces[position]
+        if piece[0] == 'n':
+            data = piece[1].pop(offset)
+            self._sizes[position] -= 1
+            if not piece[1]:
+                del self._pieces[position]
+                del self._sizes[position]
+        else:
+            _, start, stop = piece
+            data = self._list.get(start + offset)
+            remaining = [('o', low, high) for low, high in ((start, start + offset), (start + offset + 1, stop))
+                         if low < high]
+            self._pieces[position:position + 1] = remaining
+            self._sizes[position:position + 1] = [high - low for _, low, high in remaining]
+        self._touch(position)
+        self._length -= 1
+        return data
+
+    def commit(self) -> None:
+        self._check_open()
+        if self._list._version != self._base_version:
+            raise RuntimeError("List was modified outside the batch before commit.")
+        self._closed = True
+        self._list._apply_pieces(self._pieces)
+
+    def rollback(self) -> None:
+        self._check_open()
+        self._closed = True
+        self._pieces = []
+        self._sizes = []
+        self._ends = []
+        self._clean = 0
@@ -0,0 +1,185 @@
+from common_definitions import Character
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate, islice
+
+BLOCK_SIZE = 1024
+
+class CharacterIndex:
+    def __init__(self):
+        self._blocks: list[str] = []
+        self._counts: list[Counter] = []
+        self._totals: Counter = Counter()
+        self._ends: list[int] = []
+        self._clean: int = 0
+        self._size: int = 0
+        self._stale: bool = True
+
+    def __repr__(self) -> str:
+        return f"CharacterIndex(characters={len(self._totals)}, blocks={len(self._blocks)}, stale={self._stale})"
+
+    @property
+    def stale(self) -> bool:
+        return self._stale
+
+    def invalidate(self) -> None:
+        self._load('')
+        self._stale = True
+
+    def rebuild(self, items) -> None:
+        self._load(''.join(items))
+        self._stale = False
+
+    def clear(self) -> None:
+        self._load('')
+        self._stale = False
+
+    def _load(self, text: str) -> None:
+        self._blocks = []
+        self._counts = []
+        self._totals = Counter()
+        self._ends = []
+        self._clean = 0
+        self._size = 0
+        self._replace(0, 0, text)
+
+    def _touch(self, block: int) -> None:
+        self._clean = min(self._clean, block)
+
+    def _refresh(self) -> list[int]:
+        ends = self._ends
+        clean = self._clean
+        if clean < len(self._blocks) or len(ends) != len(self._blocks):
+            total = ends[clean - 1] if clean else 0
+            ends[clean:] = islice(accumulate(map(len, self._blocks[clean:]), initial=total), 1, None)
+            self._clean = len(self._blocks)
+        return ends
+
+    def _start(self, block: int) -> int:
+        return self._refresh()[block - 1] if block else 0
+
+    def _locate(self, position: int) -> tuple[int, int]:
+        if position >= self._size:
+            return len(self._blocks) - 1, len(self._blocks[-1])
+        ends = self._refresh()
+        block = bisect_right(ends, position)
+        return block, position - (ends[block - 1] if block else 0)
+
+    def _replace(self, first: int, last: int, text: str) -> None:
+        for counts in self._counts[first:last]:
+            self._totals -= counts
+        self._size -= sum(map(len, self._blocks[first:last]))
+        pieces = [text[start:start + BLOCK_SIZE] for start in range(0, len(text), BLOCK_SIZE)]
+        counts = [Counter(piece) for piece in pieces]
+        for piece_counts in counts:
+            self._totals.update(piece_counts)
+        self._blocks[first:last] = pieces
+        self._counts[first:last] = counts
+        self._size += len(text)
+        self._touch(first)
+
+    def __contains__(self, element: Character) -> bool:
+        return element in self._totals
+
+    def count(self, element: Character) -> int:
+        return self._totals.get(element, 0)
+
+    def first(self, element: Character) -> int:
+        if element not in self._totals:
+            return -1
+        block = next(block for block, counts in enumerate(self._counts) if element in counts)
+        return self._start(block) + self._blocks[block].find(element)
+
+    def last(self, element: Character) -> int:
+        if element not in self._totals:
+            return -1
+        block = next(block for block in range(len(self._counts) - 1, -1, -1) if element in self._counts[block])
+        return self._start(block) + self._blocks[block].rfind(element)
+
+    def append(self, element: Character, position: int) -> None:
+        self.insert(element, position)
+
+    def extend(self, items, start: int) -> None:
+        self.insert_text(start, ''.join(items))
+
+    def insert(self, element: Character, position: int) -> None:
+        if self._stale:
+            return
+        if not self._blocks:
+            self._replace(0, 0, element)
+            return
+        block, offset = self._locate(position)
+        text = self._blocks[block]
+        if len(text) >= 2 * BLOCK_SIZE:
+            self._replace(block, block + 1, text[:offset] + element + text[offset:])
+            return
+        self._blocks[block] = text[:offset] + element + text[offset:]
+        self._counts[block][element] += 1
+        self._totals[element] += 1
+        self._size += 1
+        self._touch(block)
+
+    def insert_text(self, position: int, text: str) -> None:
+        if self._stale or not text:
+            return
+        if not self._blocks:
+            self._replace(0, 0, text)
+            return
+        block, offset = self._locate(position)
+        current = self._blocks[block]
+        if len(current) + len(text) <= 2 * BLOCK_SIZE:
+            self._blocks[block] = current[:offset] + text + current[offset:]
+            self._counts[block].update(text)
+            self._totals.update(text)
+            self._size += len(text)
+            self._touch(block)
+        else:
+            self._replace(block, block + 1, current[:offset] + text + current[offset:])
+
+    def delete(self, element: Character, position: int) -> None:
+        if self._stale:
+            return
+        block, offset = self._locate(position)
+        text = self._blocks[block]
+        text = text[:offset] + text[offset + 1:]
+        if not text or (len(text) < BLOCK_SIZE // 4 and block + 1 < len(self._blocks)):
+            self._replace(block, block + 2, text + ''.join(self._blocks[block + 1:block + 2]))
+            return
+        self._blocks[block] = text
+        counts = self._counts[block]
+        counts[element] -= 1
+        if not counts[element]:
+            del counts[element]
+        self._totals[element] -= 1
+        if not self._totals[element]:
+            del self._totals[element]
+        self._size -= 1
+        self._touch(block)
+
+    def delete_range(self, start: int, stop: int) -> None:
+        if self._stale or start >= stop:
+            return
+        first, first_offset = self._locate(start)
+        last, last_offset = self._locate(stop - 1)
+        self._replace(first, last + 1, self._blocks[first][:first_offset] + self._blocks[last][last_offset + 1:])
+
+    def remove_all(self, element: Character) -> None:
+        if self._stale or element not in self._totals:
+            return
+        touched = [block for block, counts in enumerate(self._counts) if element in counts]
+        for block in touched:
+            self._blocks[block] = self._blocks[block].replace(element, '')
+            del self._counts[block][element]
+        self._size -= self._totals.pop(element)
+        if any(not self._blocks[block] for block in touched):
+            kept = [block for block, text in enumerate(self._blocks) if text]
+            self._blocks = [self._blocks[block] for block in kept]
+            self._counts = [self._counts[block] for block in kept]
+        self._touch(touched[0])
+
+    def reverse(self, length: int) -> None:
+        if self._stale:
+            return
+        self._blocks = [text[::-1] for text in reversed(self._blocks)]
+        self._counts.reverse()
+        self._clean = 0
@@ -0,0 +1,173 @@
+from common_definitions import Character, is_character, warn_non_character
+from contextlib import contextmanager
+from typing import Optional
+from list_based_impl import ListBasedList
+import threading
+
+class ReadWriteLock:
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers: int = 0
+        self._writer: Optional[int] = None
+        self._writer_depth: int = 0
+        self._waiting_writers: int = 0
+        self._local = threading.local()
+
+    def acquire_read(self) -> None:
+        reads = getattr(self._local, 'reads', 0)
+        if reads == 0:
+            self._local.shared = self._writer != threading.get_ident()
+            if self._local.shared:
+                with self._condition:
+                    while self._writer is not None or self._waiting_writers:
+                        self._condition.wait()
+                    self._readers += 1
+        self._local.reads = reads + 1
+
+    def release_read(self) -> None:
+        reads = getattr(self._local, 'reads', 0)
+        if reads == 0:
+            raise RuntimeError("Cannot release a read lock that is not held.")
+        self._local.reads = reads - 1
+        if reads == 1 and self._local.shared:
+            with self._condition:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        if self._writer == threading.get_ident():
+            self._writer_depth += 1
+            return
+        if getattr(self._local, 'reads', 0):
+            raise RuntimeError("Cannot acquire the write lock while holding a read lock.")
+        with self._condition:
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = threading.get_ident()
+            self._writer_depth = 1
+
+    def release_write(self) -> None:
+        if self._writer != threading.get_ident():
+            raise RuntimeError("Cannot release a write lock that is not held.")
+        self._writer_depth -= 1
+        if self._writer_depth:
+            return
+        with self._condition:
+            self._writer = None
+            self._condition.notify_all()
+
+    @contextmanager
+    def read_locked(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+class ConcurrentList:
+    def __init__(self, initial_data=None, list_type=ListBasedList):
+        self._list = list_type(initial_data)
+        self._lock = ReadWriteLock()
+
+    def __str__(self) -> str:
+        return str(self.snapshot())
+
+    def __repr__(self) -> str:
+        return f"ConcurrentList({self._list!r})"
+
+    def __len__(self) -> int:
+        return self.length()
+
+    def __iter__(self):
+        snapshot = self.snapshot()
+        return (snapshot.get(index) for index in range(snapshot.length()))
+
+    def __contains__(self, element) -> bool:
+        return is_character(element) and self.findFirst(element) != -1
+
+    def snapshot(self):
+        with self._lock.read_locked():
+            return self._list.clone()
+
+    @contextmanager
+    def reading(self):
+        with self._lock.read_locked():
+            yield self._list
+
+    @contextmanager
+    def writing(self):
+        with self._lock.write_locked():
+            yield self._list
+
+    def length(self) -> int:
+        with self._lock.read_locked():
+            return self._list.length()
+
+    def get(self, index: int) -> Character:
+        with self._lock.read_locked():
+            return self._list.get(index)
+
+    def findFirst(self, element: Character) -> int:
+        if not is_character(element):
+            warn_non_character('findFirst', element, "Returning -1.")
+            return -1
+        with self._lock.read_locked():
+            return self._list.findFirst(element)
+
+    def findLast(self, element: Character) -> int:
+        if not is_character(element):
+            warn_non_character('findLast', element, "Returning -1.")
+            return -1
+        with self._lock.read_locked():
+            return self._list.findLast(element)
+
+    def append(self, element: Character) -> None:
+        with self._lock.write_locked():
+            self._list.append(element)
+
+    def insert(self, element: Character, index: int) -> None:
+        with self._lock.write_locked():
+            self._list.insert(element, index)
+
+    def delete(self, index: int) -> Character:
+        with self._lock.write_locked():
+            return self._list.delete(index)
+
+    def deleteAll(self, element: Character) -> None:
+        if not is_character(element):
+            warn_non_character('deleteAll', element, "No elements will be deleted.")
+            return
+        with self._lock.write_locked():
+            self._list.deleteAll(element)
+
+    def clone(self) -> 'ConcurrentList':
+        new_list = ConcurrentList(list_type=self._list.__class__)
+        new_list._list = self.snapshot()
+        return new_list
+
+    def reverse(self) -> None:
+        with self._lock.write_locked():
+            self._list.reverse()
+
+    def clear(self) -> None:
+        with self._lock.write_locked():
+            self._list.clear()
+
+    def extend(self, elements) -> None:
+        if isinstance(elements, ConcurrentList):
+            elements = elements.snapshot()
+        with self._lock.write_locked():
+            self._list.extend(elements)
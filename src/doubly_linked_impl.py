@@ -1,6 +1,13 @@
-from common_definitions import Character, InvalidIndexError, CharacterTypeError, is_character
-import sys
+from common_definitions import Character, InvalidIndexError, CharacterTypeError, is_character, to_characters, warn_non_character
+from src.char_index import CharacterIndex
+from src.batch import Batch
+from src.sharing import share, detach
+from src import streaming, serialization, parallel
+import weakref
+from typing import Optional
 class Node:
+    __slots__ = ('data', 'next', 'prev')
+
     def __init__(self, data: Character = None, next_node: 'Node' = None, prev_node: 'Node' = None):
         if data is not None and not is_character(data):
             raise CharacterTypeError(f"Node data must be a single character string or None. Got: {data}")
@@ -11,33 +18,152 @@ class Node:
     def __repr__(self):
         return f"Node(data={self.data!r})"
 
+def _new_node(data: Character, next_node: Optional[Node] = None, prev_node: Optional[Node] = None) -> Node:
+    node = Node.__new__(Node)
+    node.data = data
+    node.next = next_node
+    node.prev = prev_node
+    return node
+
+def _build_chain(items: list) -> tuple[Optional[Node], Optional[Node]]:
+    nodes = [Node.__new__(Node) for _ in items]
+    last = None
+    for new_node, item in zip(nodes, items):
+        new_node.data = item
+        new_node.prev = last
+        new_node.next = None
+        if last:
+            last.next = new_node
+        last = new_node
+    return (nodes[0] if nodes else None), last
+
 class DoublyLinkedList:
-    def __init__(self, initial_data=None):
+    def __init__(self, initial_data=None, indexed: bool = False, validate: bool = True):
         self._head: Node | None = None
         self._tail: Node | None = None
         self._length: int = 0
+        self._index: CharacterIndex | None = CharacterIndex() if indexed else None
+        self._finger: tuple[Node, int] | None = None
+        self._sharers: list[int] = [1]
+        self._release: Optional[weakref.finalize] = None
+        self._reversed: bool = False
+        self._version: int = 0
         if initial_data:
-             for item in initial_data:
-                  self.append(item)
+            self._link_chain(to_characters(initial_data, validate), None, 0)
 
     def __str__(self) -> str:
-        items = []
-        current = self._head
-        while current:
-            items.append(repr(current.data))
-            current = current.next
-        return f"[{', '.join(items)}]"
+        return f"[{', '.join(repr(item) for item in self)}]"
 
     def __repr__(self) -> str:
         return f"DoublyLinkedList(length={self._length})"
 
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        return self._walk(backwards=self._reversed)
+
+    def __reversed__(self):
+        return self._walk(backwards=not self._reversed)
+
+    def _walk(self, backwards: bool = False):
+        current = self._tail if backwards else self._head
+        while current:
+            yield current.data
+            current = current.prev if backwards else current.next
+
+    def __contains__(self, element) -> bool:
+        if not is_character(element):
+            return False
+        if self._index is not None:
+            return element in self._fresh_index()
+        return any(item == element for item in self)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            new_list = DoublyLinkedList(indexed=self._index is not None)
+            new_list._link_chain(self._slice_items(key), None, 0)
+            return new_list
+        if key < 0:
+            key += self._length
+        return self.get(key)
+
+    def _slice_items(self, key: slice) -> list[Character]:
+        if self._reversed:
+            return list(self)[key]
+        start, stop, step = key.indices(self._length)
+        count = len(range(start, stop, step))
+        if count == 0:
+            return []
+        current = self._get_node_at_index(start)
+        items = [current.data]
+        for _ in range(count - 1):
+            for _ in range(abs(step)):
+                current = current.next if step > 0 else current.prev
+            items.append(current.data)
+        return items
+
+    def to_str(self, start: int = 0, stop: Optional[int] = None) -> str:
+        return ''.join(self._slice_items(slice(start, stop)))
+
     def length(self) -> int:
         return self._length
 
+    def set_indexed(self, enabled: bool) -> None:
+        if not enabled:
+            self._index = None
+        elif self._index is None:
+            self._index = CharacterIndex()
+
+    def _physical(self, index: int) -> int:
+        return self._length - 1 - index if self._reversed else index
+
+    def _materialize(self) -> None:
+        if not self._reversed:
+            return
+        self._ensure_owned()
+        current = self._head
+        while current:
+            next_node = current.next
+            current.next = current.prev
+            current.prev = next_node
+            current = next_node
+        self._head, self._tail = self._tail, self._head
+        if self._finger:
+            self._finger = (self._finger[0], self._length - 1 - self._finger[1])
+        self._reversed = False
+        if self._index is not None:
+            self._index.reverse(self._length)
+
+    def _detach(self) -> None:
+        detach(self)
+
+    def _ensure_owned(self) -> bool:
+        if self._sharers[0] == 1:
+            return False
+        head, tail = _build_chain(list(self._walk()))
+        self._detach()
+        self._head, self._tail = head, tail
+        self._reset_finger()
+        return True
+
+    def _fresh_index(self) -> CharacterIndex:
+        if self._index.stale:
+            self._index.rebuild(self._walk())
+        return self._index
+
     def append(self, element: Character) -> None:
         if not is_character(element):
             raise CharacterTypeError(f"Can only append a single character string. Got: {element}")
-        new_node = Node(element)
+        self._version += 1
+        self._ensure_owned()
+        if self._reversed:
+            self._insert_before(self._head, element, 0)
+        else:
+            self._append_node(element)
+
+    def _append_node(self, element: Character) -> None:
+        new_node = _new_node(element)
         if not self._head:
             self._head = new_node
             self._tail = new_node
@@ -46,51 +172,79 @@ class DoublyLinkedList:
             new_node.prev = self._tail
             self._tail = new_node
         self._length += 1
+        if self._index is not None:
+            self._index.append(element, self._length - 1)
 
-    def _get_node_at_index(self, index: int) -> Node:
-         if not (0 <= index < self._length):
-             raise InvalidIndexError(f"Index {index} is out of bounds (0 to {self._length - 1})")
-         if index < self._length // 2:
-             current = self._head
-             for _ in range(index):
-                 current = current.next
-             return current
-         else:
-             current = self._tail
-             for _ in range(self._length - 1, index, -1):
-                 current = current.prev
-             return current
+    def _link_chain(self, items: list, before: Optional[Node], position: int) -> None:
+        if not items:
+            return
+        first, last = _build_chain(items)
+        prev_node = before.prev if before else self._tail
+        first.prev = prev_node
+        last.next = before
+        if prev_node:
+            prev_node.next = first
+        else:
+            self._head = first
+        if before:
+            before.prev = last
+            self._reset_finger()
+        else:
+            self._tail = last
+        if self._index is not None:
+            self._index.extend(items, position)
+        self._length += len(items)
 
-    def insert(self, element: Character, index: int) -> None:
-        if not is_character(element):
-            raise CharacterTypeError(f"Can only insert a single character string. Got: {element}")
-        if not (0 <= index <= self._length):
-             raise InvalidIndexError(f"Index {index} is out of bounds for insertion (0 to {self._length})")
-        if index == self._length:
-            self.append(element)
-        elif index == 0:
-            new_node = Node(element, next_node=self._head)
-            if self._head:
-                self._head.prev = new_node
-            self._head = new_node
-            if not self._tail:
-                self._tail = new_node
-            self._length += 1
+    def _get_node_at_index(self, index: int) -> Node:
+        if not (0 <= index < self._length):
+            raise InvalidIndexError(f"Index {index} is out of bounds (0 to {self._length - 1})")
+        tail_distance = self._length - 1 - index
+        finger = self._finger
+        finger_distance = abs(index - finger[1]) if finger else self._length
+        if finger_distance < index and finger_distance < tail_distance:
+            current, finger_index = finger
+            if index > finger_index:
+                for _ in range(index - finger_index):
+                    current = current.next
+            else:
+                for _ in range(finger_index - index):
+                    current = current.prev
+        elif index <= tail_distance:
+            current = self._head
+            for _ in range(index):
+                current = current.next
         else:
-            existing_node = self._get_node_at_index(index)
-            prev_node = existing_node.prev
-            new_node = Node(element, next_node=existing_node, prev_node=prev_node)
+            current = self._tail
+            for _ in range(tail_distance):
+                current = current.prev
+        self._finger = (current, index)
+        return current
+
+    def _reset_finger(self) -> None:
+        self._finger = None
+
+    def _insert_before(self, existing_node: Optional[Node], element: Character, index: int) -> Node:
+        prev_node = existing_node.prev if existing_node else self._tail
+        new_node = _new_node(element, existing_node, prev_node)
+        if prev_node:
             prev_node.next = new_node
+        else:
+            self._head = new_node
+        if existing_node:
             existing_node.prev = new_node
-            self._length += 1
+        else:
+            self._tail = new_node
+        self._length += 1
+        if self._finger and self._finger[1] >= index:
+            self._finger = (self._finger[0], self._finger[1] + 1)
+        if self._index is not None:
+            self._index.insert(element, index)
+        return new_node
 
-    def delete(self, index: int) -> Character:
-        if not (0 <= index < self._length):
-            raise InvalidIndexError(f"Index {index} is out of bounds for deletion (0 to {self._length - 1})")
-        node_to_delete = self._get_node_at_index(index)
-        data = node_to_delete.data
-        prev_node = node_to_delete.prev
-        next_node = node_to_delete.next
+    def _unlink_node(self, node: Node, index: int) -> Character:
+        data = node.data
+        prev_node = node.prev
+        next_node = node.next
         if prev_node:
             prev_node.next = next_node
         else:
@@ -99,19 +253,52 @@ class DoublyLinkedList:
             next_node.prev = prev_node
         else:
             self._tail = prev_node
-        node_to_delete.next = None
-        node_to_delete.prev = None
-        node_to_delete.data = None
+        node.next = None
+        node.prev = None
+        node.data = None
         self._length -= 1
-        if self._length == 0:
-             self._head = None
-             self._tail = None
+        if self._finger and self._finger[0] is node:
+            self._finger = (next_node, index) if next_node else None
+        elif self._finger and self._finger[1] > index:
+            self._finger = (self._finger[0], self._finger[1] - 1)
+        if self._index is not None:
+            self._index.delete(data, index)
         return data
 
+    def insert(self, element: Character, index: int) -> None:
+        if not is_character(element):
+            raise CharacterTypeError(f"Can only insert a single character string. Got: {element}")
+        if not (0 <= index <= self._length):
+             raise InvalidIndexError(f"Index {index} is out of bounds for insertion (0 to {self._length})")
+        self._version += 1
+        self._ensure_owned()
+        physical = self._length - index if self._reversed else index
+        if physical == self._length:
+            self._append_node(element)
+        elif physical == 0:
+            self._insert_before(self._head, element, 0)
+        else:
+            self._insert_before(self._get_node_at_index(physical), element, physical)
+
+    def delete(self, index: int) -> Character:
+        if not (0 <= index < self._length):
+            raise InvalidIndexError(f"Index {index} is out of bounds for deletion (0 to {self._length - 1})")
+        self._version += 1
+        self._ensure_owned()
+        physical = self._physical(index)
+        return self._unlink_node(self._get_node_at_index(physical), physical)
+
+    def cursor(self, index: int = 0) -> 'Cursor':
+        return Cursor(self, index)
+
     def deleteAll(self, element: Character) -> None:
         if not is_character(element):
-             print(f"Warning: deleteAll received non-character element '{element}'. No elements will be deleted.", file=sys.stderr)
+             warn_non_character('deleteAll', element, "No elements will be deleted.")
              return
+        if self._index is not None and element not in self._fresh_index():
+            return
+        self._version += 1
+        self._ensure_owned()
         current = self._head
         while current:
             if current.data == element:
@@ -136,34 +323,51 @@ class DoublyLinkedList:
         if self._length == 0:
              self._head = None
              self._tail = None
+        self._reset_finger()
+        if self._index is not None:
+            self._index.remove_all(element)
 
     def get(self, index: int) -> Character:
-        node = self._get_node_at_index(index)
-        return node.data
+        if not (0 <= index < self._length):
+            raise InvalidIndexError(f"Index {index} is out of bounds (0 to {self._length - 1})")
+        return self._get_node_at_index(self._physical(index)).data
 
     def clone(self) -> 'DoublyLinkedList':
-        new_list = DoublyLinkedList()
-        current = self._head
-        while current:
-            new_list.append(current.data)
-            current = current.next
+        new_list = DoublyLinkedList(indexed=self._index is not None)
+        new_list._head = self._head
+        new_list._tail = self._tail
+        new_list._length = self._length
+        share(self, new_list)
+        new_list._reversed = self._reversed
         return new_list
 
     def reverse(self) -> None:
-        if self._length <= 1:
-            return
-        current = self._head
-        while current:
-            next_node = current.next
-            current.next = current.prev
-            current.prev = next_node
-            current = next_node
-        self._head, self._tail = self._tail, self._head
+        self._version += 1
+        self._reversed = not self._reversed
 
     def findFirst(self, element: Character) -> int:
         if not is_character(element):
-             print(f"Warning: findFirst received non-character element '{element}'. Returning -1.", file=sys.stderr)
+             warn_non_character('findFirst', element, "Returning -1.")
              return -1
+        if self._reversed:
+            position = self._find_last_physical(element)
+        else:
+            position = self._find_first_physical(element)
+        return self._physical(position) if position != -1 else -1
+
+    def findLast(self, element: Character) -> int:
+        if not is_character(element):
+             warn_non_character('findLast', element, "Returning -1.")
+             return -1
+        if self._reversed:
+            position = self._find_first_physical(element)
+        else:
+            position = self._find_last_physical(element)
+        return self._physical(position) if position != -1 else -1
+
+    def _find_first_physical(self, element: Character) -> int:
+        if self._index is not None:
+            return self._fresh_index().first(element)
         current = self._head
         index = 0
         while current:
@@ -173,10 +377,9 @@ class DoublyLinkedList:
             index += 1
         return -1
 
-    def findLast(self, element: Character) -> int:
-        if not is_character(element):
-             print(f"Warning: findLast received non-character element '{element}'. Returning -1.", file=sys.stderr)
-             return -1
+    def _find_last_physical(self, element: Character) -> int:
+        if self._index is not None:
+            return self._fresh_index().last(element)
         current = self._tail
         index = self._length - 1
         while current:
@@ -187,20 +390,286 @@ class DoublyLinkedList:
         return -1
 
     def clear(self) -> None:
+        self._version += 1
+        self._detach()
         self._head = None
         self._tail = None
         self._length = 0
+        self._reversed = False
+        self._reset_finger()
+        if self._index is not None:
+            self._index.clear()
 
     def extend(self, elements: 'DoublyLinkedList') -> None:
         if not isinstance(elements, DoublyLinkedList):
              raise TypeError("Can only extend with another DoublyLinkedList instance.")
-        if elements.length() == 0:
-             return
-        if self.length() == 0:
-             self._head = None
-             self._tail = None
-             self._length = 0
-        current = elements._head
+        self._version += 1
+        items = list(elements)
+        self._ensure_owned()
+        if self._reversed:
+            items.reverse()
+            self._link_chain(items, self._head, 0)
+        else:
+            self._link_chain(items, None, self._length)
+
+    def extend_from_str(self, text: str) -> None:
+        if not isinstance(text, str):
+            raise TypeError("Can only extend from a str instance.")
+        self._version += 1
+        self._ensure_owned()
+        if self._reversed:
+            self._link_chain(list(reversed(text)), self._head, 0)
+        else:
+            self._link_chain(list(text), None, self._length)
+
+    def insert_many(self, index: int, elements) -> None:
+        items = to_characters(elements)
+        if not (0 <= index <= self._length):
+            raise InvalidIndexError(f"Index {index} is out of bounds for insertion (0 to {self._length})")
+        self._version += 1
+        self._materialize()
+        self._ensure_owned()
+        before = self._get_node_at_index(index) if index < self._length else None
+        self._link_chain(items, before, index)
+
+    def delete_range(self, start: int, stop: int) -> None:
+        if not (0 <= start <= stop <= self._length):
+            raise InvalidIndexError(f"Range {start}:{stop} is out of bounds for deletion (0 to {self._length})")
+        if start == stop:
+            return
+        self._version += 1
+        self._materialize()
+        self._ensure_owned()
+        first = self._get_node_at_index(start)
+        last = first
+        for _ in range(stop - start - 1):
+            last = last.next
+        prev_node = first.prev
+        next_node = last.next
+        if prev_node:
+            prev_node.next = next_node
+        else:
+            self._head = next_node
+        if next_node:
+            next_node.prev = prev_node
+        else:
+            self._tail = prev_node
+        first.prev = None
+        last.next = None
+        self._length -= stop - start
+        self._reset_finger()
+        if self._index is not None:
+            self._index.delete_range(start, stop)
+
+    def splice(self, elements: 'DoublyLinkedList') -> None:
+        if not isinstance(elements, DoublyLinkedList):
+            raise TypeError("Can only splice another DoublyLinkedList instance.")
+        if elements is self:
+            raise ValueError("Cannot splice a list into itself.")
+        if elements._length == 0:
+            return
+        self._version += 1
+        self._materialize()
+        elements._materialize()
+        self._ensure_owned()
+        elements._ensure_owned()
+        if self._index is not None:
+            self._index.extend(elements._walk(), self._length)
+        if self._tail:
+            self._tail.next = elements._head
+            elements._head.prev = self._tail
+        else:
+            self._head = elements._head
+        self._tail = elements._tail
+        self._length += elements._length
+        elements.clear()
+
+    def split_at(self, index: int) -> 'DoublyLinkedList':
+        if not (0 <= index <= self._length):
+            raise InvalidIndexError(f"Index {index} is out of bounds for split (0 to {self._length})")
+        suffix = DoublyLinkedList()
+        if index == self._length:
+            return suffix
+        self._version += 1
+        self._materialize()
+        self._ensure_owned()
+        node = self._get_node_at_index(index)
+        suffix._head = node
+        suffix._tail = self._tail
+        suffix._length = self._length - index
+        self._tail = node.prev
+        if node.prev:
+            node.prev.next = None
+        else:
+            self._head = None
+        node.prev = None
+        if self._index is not None:
+            self._index.delete_range(index, self._length)
+        self._length = index
+        self._reset_finger()
+        return suffix
+
+
+    def batch(self) -> Batch:
+        return Batch(self)
+
+    async def extend_from_stream(self, reader, chunk_size: int = streaming.DEFAULT_CHUNK_SIZE,
+                                 encoding: str = 'utf-8') -> int:
+        return await streaming.extend_from_stream(self, reader, chunk_size, encoding)
+
+    def iter_chunks(self, chunk_size: int = streaming.DEFAULT_CHUNK_SIZE):
+        return streaming.iter_chunks(self, chunk_size)
+
+    async def write_to_stream(self, writer, chunk_size: int = streaming.DEFAULT_CHUNK_SIZE,
+                              encoding: str = 'utf-8') -> int:
+        return await streaming.write_to_stream(self, writer, chunk_size, encoding)
+
+    def save(self, destination, encoding: str = 'utf-32', compression: Optional[str] = None) -> None:
+        serialization.save_to(self, destination, encoding, compression)
+
+    @classmethod
+    def load(cls, source) -> 'DoublyLinkedList':
+        return serialization.load_from(cls(), source)
+
+    def to_bytes(self, encoding: str = 'utf-32', compression: Optional[str] = None) -> bytes:
+        return serialization.to_bytes(self, encoding, compression)
+
+    @classmethod
+    def from_bytes(cls, data) -> 'DoublyLinkedList':
+        return serialization.from_bytes(cls(), data)
+
+    def find(self, pattern: str, workers: Optional[int] = None) -> int:
+        return parallel.find(self, pattern, workers)
+
+    def rfind(self, pattern: str, workers: Optional[int] = None) -> int:
+        return parallel.rfind(self, pattern, workers)
+
+    def find_all(self, pattern: str, workers: Optional[int] = None) -> list[int]:
+        return parallel.find_all(self, pattern, workers)
+
+    def count(self, pattern: str, workers: Optional[int] = None) -> int:
+        return parallel.count(self, pattern, workers)
+
+    def delete_all_of(self, characters, workers: Optional[int] = None) -> int:
+        return parallel.delete_all_of(self, characters, workers)
+
+    def _apply_pieces(self, pieces: list) -> None:
+        self._version += 1
+        self._materialize()
+        self._ensure_owned()
+        current = self._head
+        position = 0
+        new_head = None
+        new_tail = None
+        length = 0
+        for piece in pieces:
+            if piece[0] == 'n':
+                first, last = _build_chain(piece[1])
+                first.prev = new_tail
+                if new_tail:
+                    new_tail.next = first
+                else:
+                    new_head = first
+                new_tail = last
+                length += len(piece[1])
+                continue
+            _, start, stop = piece
+            while position < stop:
+                node = current
+                current = current.next
+                if position < start:
+                    node.next = None
+                    node.prev = None
+                else:
+                    node.prev = new_tail
+                    if new_tail:
+                        new_tail.next = node
+                    else:
+                        new_head = node
+                    new_tail = node
+                    length += 1
+                position += 1
         while current:
-            self.append(current.data)
-            current = current.next
\ No newline at end of file
+            node = current
+            current = current.next
+            node.next = None
+            node.prev = None
+        if new_tail:
+            new_tail.next = None
+        self._head = new_head
+        self._tail = new_tail
+        self._length = length
+        self._reset_finger()
+        if self._index is not None:
+            self._index.invalidate()
+
+
+class Cursor:
+    def __init__(self, owner: DoublyLinkedList, index: int = 0):
+        if not (0 <= index <= owner._length):
+            raise InvalidIndexError(f"Index {index} is out of bounds for a cursor (0 to {owner._length})")
+        owner._materialize()
+        self._list: DoublyLinkedList = owner
+        self._index: int = index
+        self._node: Node | None = owner._get_node_at_index(index) if index < owner._length else None
+        self._version: int = owner._version
+
+    def __repr__(self) -> str:
+        return f"Cursor(index={self._index})"
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    def at_end(self) -> bool:
+        return self._node is None
+
+    def _check_version(self) -> None:
+        if self._list._version != self._version:
+            raise RuntimeError("The list was modified outside this cursor; create a new cursor.")
+
+    def get(self) -> Character:
+        self._check_version()
+        if self._node is None:
+            raise InvalidIndexError(f"Cursor at index {self._index} is past the end of the list")
+        return self._node.data
+
+    def next(self) -> None:
+        self._check_version()
+        if self._node is None:
+            raise InvalidIndexError(f"Cursor at index {self._index} cannot move past the end of the list")
+        self._node = self._node.next
+        self._index += 1
+
+    def prev(self) -> None:
+        self._check_version()
+        if self._index == 0:
+            raise InvalidIndexError("Cursor at index 0 cannot move before the start of the list")
+        self._node = self._node.prev if self._node else self._list._tail
+        self._index -= 1
+
+    def _sync(self) -> None:
+        if self._list._ensure_owned():
+            self._node = self._list._get_node_at_index(self._index) if self._index < self._list._length else None
+
+    def insert_here(self, element: Character) -> None:
+        if not is_character(element):
+            raise CharacterTypeError(f"Can only insert a single character string. Got: {element}")
+        self._check_version()
+        self._list._version += 1
+        self._version = self._list._version
+        self._sync()
+        self._list._insert_before(self._node, element, self._index)
+        self._index += 1
+
+    def delete_here(self) -> Character:
+        if self._node is None:
+            raise InvalidIndexError(f"Cursor at index {self._index} is past the end of the list")
+        self._check_version()
+        self._list._version += 1
+        self._version = self._list._version
+        self._sync()
+        next_node = self._node.next
+        data = self._list._unlink_node(self._node, self._index)
+        self._node = next_node
+        return data
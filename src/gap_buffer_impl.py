@@ -0,0 +1,139 @@
+from common_definitions import Character, InvalidIndexError, CharacterTypeError, is_character, warn_non_character
+
+MIN_GAP = 16
+
+class GapBufferList:
+    def __init__(self, initial_data=None):
+        self._buffer: list = [None] * MIN_GAP
+        self._gap_start: int = 0
+        self._gap_end: int = MIN_GAP
+        if initial_data:
+            items = list(initial_data)
+            for item in items:
+                if not is_character(item):
+                    raise CharacterTypeError(f"Initial data must contain only characters. Found: {item}")
+            self._reset(items)
+
+    def __str__(self) -> str:
+        return f"[{', '.join(repr(item) for item in self._contents())}]"
+
+    def __repr__(self) -> str:
+        return f"GapBufferList(length={self.length()}, gap={self._gap_start})"
+
+    def _reset(self, items: list) -> None:
+        gap = max(MIN_GAP, len(items) // 4)
+        self._buffer = items + [None] * gap
+        self._gap_start = len(items)
+        self._gap_end = len(self._buffer)
+
+    def _contents(self) -> list:
+        return self._buffer[:self._gap_start] + self._buffer[self._gap_end:]
+
+    def _gap_size(self) -> int:
+        return self._gap_end - self._gap_start
+
+    def _move_gap(self, index: int) -> None:
+        buffer = self._buffer
+        if index < self._gap_start:
+            count = self._gap_start - index
+            buffer[self._gap_end - count:self._gap_end] = buffer[index:self._gap_start]
+            self._gap_start -= count
+            self._gap_end -= count
+        elif index > self._gap_start:
+            count = index - self._gap_start
+            buffer[self._gap_start:index] = buffer[self._gap_end:self._gap_end + count]
+            self._gap_start += count
+            self._gap_end += count
+
+    def _ensure_gap(self, needed: int) -> None:
+        if self._gap_size() >= needed:
+            return
+        extra = max(needed, len(self._buffer), MIN_GAP)
+        self._buffer[self._gap_end:self._gap_end] = [None] * extra
+        self._gap_end += extra
+
+    def length(self) -> int:
+        return len(self._buffer) - self._gap_size()
+
+    def append(self, element: Character) -> None:
+        if not is_character(element):
+            raise CharacterTypeError(f"Can only append a single character string. Got: {element}")
+        self._move_gap(self.length())
+        self._ensure_gap(1)
+        self._buffer[self._gap_start] = element
+        self._gap_start += 1
+
+    def insert(self, element: Character, index: int) -> None:
+        if not is_character(element):
+            raise CharacterTypeError(f"Can only insert a single character string. Got: {element}")
+        if not (0 <= index <= self.length()):
+            raise InvalidIndexError(f"Index {index} is out of bounds for insertion (0 to {self.length()})")
+        self._move_gap(index)
+        self._ensure_gap(1)
+        self._buffer[self._gap_start] = element
+        self._gap_start += 1
+
+    def delete(self, index: int) -> Character:
+        if not (0 <= index < self.length()):
+            raise InvalidIndexError(f"Index {index} is out of bounds for deletion (0 to {self.length() - 1})")
+        self._move_gap(index)
+        data = self._buffer[self._gap_end]
+        self._buffer[self._gap_end] = None
+        self._gap_end += 1
+        return data
+
+    def deleteAll(self, element: Character) -> None:
+        if not is_character(element):
+            warn_non_character('deleteAll', element, "No elements will be deleted.")
+            return
+        self._reset([item for item in self._contents() if item != element])
+
+    def get(self, index: int) -> Character:
+        if not (0 <= index < self.length()):
+            raise InvalidIndexError(f"Index {index} is out of bounds (0 to {self.length() - 1})")
+        if index < self._gap_start:
+            return self._buffer[index]
+        return self._buffer[index + self._gap_size()]
+
+    def clone(self) -> 'GapBufferList':
+        new_list = GapBufferList()
+        new_list._buffer = self._buffer[:]
+        new_list._gap_start = self._gap_start
+        new_list._gap_end = self._gap_end
+        return new_list
+
+    def reverse(self) -> None:
+        items = self._contents()
+        items.reverse()
+        self._reset(items)
+
+    def findFirst(self, element: Character) -> int:
+        if not is_character(element):
+            warn_non_character('findFirst', element, "Returning -1.")
+            return -1
+        try:
+            return self._buffer.index(element, 0, self._gap_start)
+        except ValueError:
+            pass
+        try:
+            return self._buffer.index(element, self._gap_end) - self._gap_size()
+        except ValueError:
+            return -1
+
+    def findLast(self, element: Character) -> int:
+        if not is_character(element):
+            warn_non_character('findLast', element, "Returning -1.")
+            return -1
+        return ''.join(self._contents()).rfind(element)
+
+    def clear(self) -> None:
+        self._reset([])
+
+    def extend(self, elements: 'GapBufferList') -> None:
+        if not isinstance(elements, GapBufferList):
+            raise TypeError("Can only extend with another GapBufferList instance.")
+        items = elements._contents()
+        self._move_gap(self.length())
+        self._ensure_gap(len(items))
+        self._buffer[self._gap_start:self._gap_start + len(items)] = items
+        self._gap_start += len(items)
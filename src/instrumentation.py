@@ -0,0 +1,202 @@
+from bisect import bisect_left
+from functools import wraps
+from typing import Optional
+import inspect
+import time
+import tracemalloc
+
+LATENCY_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 1e-2, 1e-1, 1.0)
+WALK_BUCKETS = (0, 1, 8, 64, 512, 4096, 32768, 262144)
+METRIC_PREFIX = 'charlist'
+_attached: dict = {}
+
+class Histogram:
+    def __init__(self, bounds: tuple):
+        self.bounds: tuple = bounds
+        self.counts: list[int] = [0] * (len(bounds) + 1)
+        self.total: float = 0
+        self.count: int = 0
+
+    def __repr__(self) -> str:
+        return f"Histogram(count={self.count}, total={self.total})"
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def reset(self) -> None:
+        self.counts = [0] * len(self.counts)
+        self.total = 0
+        self.count = 0
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        running = 0
+        buckets = []
+        for bound, count in zip(self.bounds + (float('inf'),), self.counts):
+            running += count
+            buckets.append(('+Inf' if bound == float('inf') else repr(bound), running))
+        return buckets
+
+    def as_dict(self) -> dict:
+        return {'buckets': dict(self.cumulative()), 'sum': self.total, 'count': self.count}
+
+class MethodStats:
+    def __init__(self):
+        self.calls: int = 0
+        self.latency: Histogram = Histogram(LATENCY_BUCKETS)
+        self.allocated_bytes: int = 0
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.latency.reset()
+        self.allocated_bytes = 0
+
+    def as_dict(self) -> dict:
+        return {'calls': self.calls, 'latency_seconds': self.latency.as_dict(),
+                'allocated_bytes': self.allocated_bytes}
+
+def _public_methods(cls) -> list[str]:
+    return [name for name, value in vars(cls).items()
+            if not name.startswith('_') and inspect.isfunction(value) and not inspect.iscoroutinefunction(value)]
+
+def _label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"')
+
+class Instrumentation:
+    def __init__(self, track_memory: bool = False):
+        self._track_memory: bool = track_memory
+        self._started_tracing: bool = False
+        self._originals: dict = {}
+        self._methods: dict = {}
+        self._walks: dict = {}
+
+    def __repr__(self) -> str:
+        return f"Instrumentation(classes={[cls.__name__ for cls in self._originals]}, track_memory={self._track_memory})"
+
+    def __enter__(self) -> 'Instrumentation':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self.detach()
+        return False
+
+    def attach(self, cls, methods: Optional[list[str]] = None) -> None:
+        if cls in _attached:
+            raise RuntimeError(f"{cls.__name__} is already instrumented.")
+        if self._track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        originals = {}
+        stats = self._methods.setdefault(cls.__name__, {})
+        for name in methods if methods is not None else _public_methods(cls):
+            originals[name] = vars(cls)[name]
+            setattr(cls, name, self._wrap(originals[name], stats.setdefault(name, MethodStats())))
+        if '_get_node_at_index' in vars(cls):
+            originals['_get_node_at_index'] = vars(cls)['_get_node_at_index']
+            walks = self._walks.setdefault(cls.__name__, Histogram(WALK_BUCKETS))
+            setattr(cls, '_get_node_at_index', self._wrap_walk(originals['_get_node_at_index'], walks))
+        self._originals[cls] = originals
+        _attached[cls] = self
+
+    def detach(self, cls=None) -> None:
+        for owner in [cls] if cls is not None else list(self._originals):
+            for name, method in self._originals.pop(owner).items():
+                setattr(owner, name, method)
+            del _attached[owner]
+        if not self._originals and self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _wrap(self, method, stats: MethodStats):
+        clock = time.perf_counter
+        observe = stats.latency.observe
+        if not self._track_memory:
+            @wraps(method)
+            def instrumented(*args, **kwargs):
+                start = clock()
+                try:
+                    return method(*args, **kwargs)
+                finally:
+                    observe(clock() - start)
+                    stats.calls += 1
+            return instrumented
+        traced = tracemalloc.get_traced_memory
+
+        @wraps(method)
+        def instrumented_with_memory(*args, **kwargs):
+            before = traced()[0]
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                observe(clock() - start)
+                stats.calls += 1
+                stats.allocated_bytes += max(0, traced()[0] - before)
+        return instrumented_with_memory
+
+    def _wrap_walk(self, method, walks: Histogram):
+        @wraps(method)
+        def instrumented_walk(owner, index):
+            length = owner._length
+            if 0 <= index < length:
+                finger = owner._finger
+                walks.observe(min(index, length - 1 - index, abs(index - finger[1]) if finger else length))
+            return method(owner, index)
+        return instrumented_walk
+
+    def reset(self) -> None:
+        for stats in self._methods.values():
+            for method_stats in stats.values():
+                method_stats.reset()
+        for walks in self._walks.values():
+            walks.reset()
+
+    def snapshot(self) -> dict:
+        result = {}
+        for class_name, stats in self._methods.items():
+            entry = {'methods': {name: method_stats.as_dict() for name, method_stats in stats.items()
+                                 if method_stats.calls}}
+            if class_name in self._walks:
+                entry['node_walk'] = self._walks[class_name].as_dict()
+            result[class_name] = entry
+        return result
+
+    def to_prometheus(self) -> str:
+        lines = [f"# HELP {METRIC_PREFIX}_calls_total Calls per list method.",
+                 f"# TYPE {METRIC_PREFIX}_calls_total counter"]
+        active = [(class_name, name, stats) for class_name, methods in self._methods.items()
+                  for name, stats in methods.items() if stats.calls]
+        for class_name, name, stats in active:
+            lines.append(f'{METRIC_PREFIX}_calls_total{{class="{_label(class_name)}",method="{_label(name)}"}} '
+                         f'{stats.calls}')
+        lines += [f"# HELP {METRIC_PREFIX}_call_duration_seconds Latency per list method.",
+                  f"# TYPE {METRIC_PREFIX}_call_duration_seconds histogram"]
+        for class_name, name, stats in active:
+            lines += self._histogram_lines(f"{METRIC_PREFIX}_call_duration_seconds", stats.latency,
+                                           f'class="{_label(class_name)}",method="{_label(name)}"')
+        if self._track_memory:
+            lines += [f"# HELP {METRIC_PREFIX}_allocated_bytes_total Net bytes allocated per list method.",
+                      f"# TYPE {METRIC_PREFIX}_allocated_bytes_total counter"]
+            for class_name, name, stats in active:
+                lines.append(f'{METRIC_PREFIX}_allocated_bytes_total{{class="{_label(class_name)}",'
+                             f'method="{_label(name)}"}} {stats.allocated_bytes}')
+        if self._walks:
+            lines += [f"# HELP {METRIC_PREFIX}_node_walk_distance Nodes walked per index lookup.",
+                      f"# TYPE {METRIC_PREFIX}_node_walk_distance histogram"]
+            for class_name, walks in self._walks.items():
+                lines += self._histogram_lines(f"{METRIC_PREFIX}_node_walk_distance", walks,
+                                               f'class="{_label(class_name)}"')
+        return '\n'.join(lines) + '\n'
+
+    def _histogram_lines(self, metric: str, histogram: Histogram, labels: str) -> list[str]:
+        lines = [f'{metric}_bucket{{{labels},le="{bound}"}} {count}' for bound, count in histogram.cumulative()]
+        lines.append(f'{metric}_sum{{{labels}}} {histogram.total}')
+        lines.append(f'{metric}_count{{{labels}}} {histogram.count}')
+        return lines
+
+def instrument(*classes, track_memory: bool = False) -> Instrumentation:
+    instrumentation = Instrumentation(track_memory)
+    for cls in classes:
+        instrumentation.attach(cls)
+    return instrumentation
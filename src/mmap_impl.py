@@ -0,0 +1,364 @@
+from common_definitions import Character, InvalidIndexError, CharacterTypeError, is_character, to_characters, warn_non_character
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, islice
+from typing import Optional
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import weakref
+
+BLOCK_CHARS = 4096
+CHAR_BYTES = 4
+BLOCK_BYTES = BLOCK_CHARS * CHAR_BYTES
+MIN_GROWTH_BLOCKS = 16
+_ENCODING = 'utf-32-le'
+_ERRORS = 'surrogatepass'
+_TABLE_HEADER = struct.Struct('<4sIII')
+_TABLE_MAGIC = b'CHBT'
+_TABLE_SAVED = 1
+_TABLE_EDITING = 0
+_CODE_POINT = struct.Struct('<I')
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+def _write_table(table_path: str, slots: array, counts: array, state: int) -> None:
+    temporary_path = table_path + '.tmp'
+    with open(temporary_path, 'wb') as table_file:
+        table_file.write(_TABLE_HEADER.pack(_TABLE_MAGIC, BLOCK_CHARS, len(slots), state))
+        table_file.write(_to_little_endian(slots))
+        table_file.write(_to_little_endian(counts))
+    os.replace(temporary_path, table_path)
+
+def _release(attributes: dict) -> None:
+    if attributes['_file'].closed:
+        return
+    if attributes['_map'] is not None:
+        attributes['_map'].flush()
+        attributes['_map'].close()
+        attributes['_map'] = None
+    if not attributes['_temporary']:
+        _write_table(attributes['_table_path'], attributes['_slots'], attributes['_counts'], _TABLE_SAVED)
+    attributes['_file'].close()
+    if attributes['_temporary']:
+        _remove_file(attributes['_path'])
+
+def _to_little_endian(values: array) -> bytes:
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+def _from_little_endian(typecode: str, data: bytes) -> array:
+    values = array(typecode, data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+class MappedList:
+    def __init__(self, initial_data=None, path: Optional[str] = None):
+        self._temporary: bool = path is None
+        if path is None:
+            handle, path = tempfile.mkstemp(suffix='.chars')
+            os.close(handle)
+        self._path: str = path
+        self._table_path: str = path + '.blocks'
+        self._slots: array = array('I')
+        self._counts: array = array('I')
+        self._ends: array = array('Q')
+        self._clean: int = 0
+        self._map: Optional[mmap.mmap] = None
+        self._saved: bool = True
+        self._file = open(path, 'r+b' if os.path.exists(path) else 'w+b')
+        size = os.fstat(self._file.fileno()).st_size
+        self._capacity: int = size // BLOCK_BYTES
+        if size:
+            try:
+                self._load_table()
+            except (OSError, ValueError):
+                self._file.close()
+                raise
+        self._release = weakref.finalize(self, _release, vars(self))
+        used = set(self._slots)
+        self._free: list[int] = [slot for slot in range(self._capacity - 1, -1, -1) if slot not in used]
+        self._length: int = sum(self._counts)
+        self._resize(self._capacity)
+        if initial_data:
+            self._append_text(initial_data if isinstance(initial_data, str) else ''.join(to_characters(initial_data)))
+
+    def __str__(self) -> str:
+        return f"[{', '.join(repr(item) for item in self)}]"
+
+    def __repr__(self) -> str:
+        return f"MappedList(path={self._path!r}, length={self._length}, blocks={len(self._slots)})"
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        for position in range(len(self._slots)):
+            yield from self._block_text(position)
+
+    def __enter__(self) -> 'MappedList':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self.close()
+        return False
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def _load_table(self) -> None:
+        if not os.path.exists(self._table_path):
+            raise ValueError(f"File {self._path} has no block table at {self._table_path}")
+        with open(self._table_path, 'rb') as table_file:
+            header = table_file.read(_TABLE_HEADER.size)
+            if len(header) != _TABLE_HEADER.size:
+                raise ValueError(f"{self._table_path} is not a block table for {BLOCK_CHARS}-character blocks")
+            magic, block_chars, blocks, state = _TABLE_HEADER.unpack(header)
+            if magic != _TABLE_MAGIC or block_chars != BLOCK_CHARS:
+                raise ValueError(f"{self._table_path} is not a block table for {BLOCK_CHARS}-character blocks")
+            if state != _TABLE_SAVED:
+                raise ValueError(f"{self._path} was edited after {self._table_path} was last saved; "
+                                 f"the block table is stale")
+            self._slots = _from_little_endian('I', table_file.read(blocks * 4))
+            self._counts = _from_little_endian('I', table_file.read(blocks * 4))
+        if len(self._counts) != blocks or any(slot >= self._capacity for slot in self._slots):
+            raise ValueError(f"{self._table_path} does not match the size of {self._path}")
+        self._clean = 0
+
+    def _mark_editing(self) -> None:
+        if self._saved and not self._temporary:
+            _write_table(self._table_path, self._slots, self._counts, _TABLE_EDITING)
+        self._saved = False
+
+    def _resize(self, capacity: int) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if capacity != self._capacity:
+            self._file.truncate(capacity * BLOCK_BYTES)
+            self._capacity = capacity
+        if capacity:
+            self._map = mmap.mmap(self._file.fileno(), capacity * BLOCK_BYTES)
+
+    def _allocate(self) -> int:
+        if not self._free:
+            capacity = self._capacity + max(MIN_GROWTH_BLOCKS, self._capacity // 2)
+            self._free = list(range(capacity - 1, self._capacity - 1, -1))
+            self._resize(capacity)
+        return self._free.pop()
+
+    def _touch(self, position: int) -> None:
+        self._clean = min(self._clean, position)
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        ends = self._ends
+        clean = self._clean
+        if clean < len(self._counts) or len(ends) != len(self._counts):
+            total = ends[clean - 1] if clean else 0
+            ends[clean:] = array('Q', islice(accumulate(self._counts[clean:], initial=total), 1, None))
+            self._clean = len(self._counts)
+        position = bisect_right(ends, index)
+        return position, index - (ends[position - 1] if position else 0)
+
+    def _block_text(self, position: int, offset: int = 0) -> str:
+        start = self._slots[position] * BLOCK_BYTES
+        stop = start + self._counts[position] * CHAR_BYTES
+        return self._map[start + offset * CHAR_BYTES:stop].decode(_ENCODING, _ERRORS)
+
+    def _write_block(self, position: int, text: str, offset: int = 0) -> None:
+        self._mark_editing()
+        start = self._slots[position] * BLOCK_BYTES + offset * CHAR_BYTES
+        data = text.encode(_ENCODING, _ERRORS)
+        self._map[start:start + len(data)] = data
+        self._counts[position] = offset + len(text)
+        self._touch(position)
+
+    def _add_block(self, position: int, text: str) -> None:
+        self._slots.insert(position, self._allocate())
+        self._counts.insert(position, 0)
+        self._write_block(position, text)
+
+    def _remove_block(self, position: int) -> None:
+        self._mark_editing()
+        self._free.append(self._slots.pop(position))
+        self._counts.pop(position)
+        self._touch(position)
+
+    def _append_text(self, text: str) -> None:
+        if not text:
+            return
+        start = 0
+        if self._slots and self._counts[-1] < BLOCK_CHARS:
+            start = BLOCK_CHARS - self._counts[-1]
+            self._write_block(len(self._slots) - 1, text[:start], self._counts[-1])
+        for offset in range(start, len(text), BLOCK_CHARS):
+            self._add_block(len(self._slots), text[offset:offset + BLOCK_CHARS])
+        self._length += len(text)
+
+    def length(self) -> int:
+        return self._length
+
+    def to_str(self, start: int = 0, stop: Optional[int] = None) -> str:
+        start, stop, _ = slice(start, stop).indices(self._length)
+        if start >= stop:
+            return ''
+        position, offset = self._locate(start)
+        parts = []
+        remaining = stop - start
+        while remaining > 0:
+            text = self._block_text(position)[offset:offset + remaining]
+            parts.append(text)
+            remaining -= len(text)
+            position += 1
+            offset = 0
+        return ''.join(parts)
+
+    def append(self, element: Character) -> None:
+        if not is_character(element):
+            raise CharacterTypeError(f"Can only append a single character string. Got: {element}")
+        self._append_text(element)
+
+    def extend_from_str(self, text: str) -> None:
+        if not isinstance(text, str):
+            raise TypeError("Can only extend from a str instance.")
+        self._append_text(text)
+
+    def insert(self, element: Character, index: int) -> None:
+        if not is_character(element):
+            raise CharacterTypeError(f"Can only insert a single character string. Got: {element}")
+        if not (0 <= index <= self._length):
+            raise InvalidIndexError(f"Index {index} is out of bounds for insertion (0 to {self._length})")
+        if index == self._length:
+            self._append_text(element)
+            return
+        position, offset = self._locate(index)
+        if self._counts[position] < BLOCK_CHARS:
+            self._write_block(position, element + self._block_text(position, offset), offset)
+        else:
+            text = self._block_text(position)
+            text = text[:offset] + element + text[offset:]
+            middle = len(text) // 2
+            self._write_block(position, text[:middle])
+            self._add_block(position + 1, text[middle:])
+        self._length += 1
+
+    def delete(self, index: int) -> Character:
+        if not (0 <= index < self._length):
+            raise InvalidIndexError(f"Index {index} is out of bounds for deletion (0 to {self._length - 1})")
+        position, offset = self._locate(index)
+        tail = self._block_text(position, offset)
+        data = tail[0]
+        count = self._counts[position] - 1
+        if count == 0:
+            self._remove_block(position)
+        elif position + 1 < len(self._slots) and count + self._counts[position + 1] <= BLOCK_CHARS // 2:
+            self._write_block(position, tail[1:] + self._block_text(position + 1), offset)
+            self._remove_block(position + 1)
+        else:
+            self._write_block(position, tail[1:], offset)
+        self._length -= 1
+        return data
+
+    def deleteAll(self, element: Character) -> None:
+        if not is_character(element):
+            warn_non_character('deleteAll', element, "No elements will be deleted.")
+            return
+        for position in range(len(self._slots) - 1, -1, -1):
+            text = self._block_text(position)
+            if element not in text:
+                continue
+            text = text.replace(element, '')
+            self._length -= self._counts[position] - len(text)
+            if text:
+                self._write_block(position, text)
+            else:
+                self._remove_block(position)
+
+    def get(self, index: int) -> Character:
+        if not (0 <= index < self._length):
+            raise InvalidIndexError(f"Index {index} is out of bounds (0 to {self._length - 1})")
+        position, offset = self._locate(index)
+        return chr(_CODE_POINT.unpack_from(self._map, self._slots[position] * BLOCK_BYTES + offset * CHAR_BYTES)[0])
+
+    def clone(self, path: Optional[str] = None) -> 'MappedList':
+        new_list = MappedList(path=path)
+        for position in range(len(self._slots)):
+            new_list._append_text(self._block_text(position))
+        return new_list
+
+    def reverse(self) -> None:
+        self._slots.reverse()
+        self._counts.reverse()
+        for position in range(len(self._slots)):
+            self._write_block(position, self._block_text(position)[::-1])
+        self._touch(0)
+
+    def findFirst(self, element: Character) -> int:
+        if not is_character(element):
+            warn_non_character('findFirst', element, "Returning -1.")
+            return -1
+        pattern = element.encode(_ENCODING, _ERRORS)
+        offset = 0
+        for position in range(len(self._slots)):
+            start = self._slots[position] * BLOCK_BYTES
+            end = start + self._counts[position] * CHAR_BYTES
+            found = self._map.find(pattern, start, end)
+            while found != -1 and (found - start) % CHAR_BYTES:
+                found = self._map.find(pattern, found + 1, end)
+            if found != -1:
+                return offset + (found - start) // CHAR_BYTES
+            offset += self._counts[position]
+        return -1
+
+    def findLast(self, element: Character) -> int:
+        if not is_character(element):
+            warn_non_character('findLast', element, "Returning -1.")
+            return -1
+        pattern = element.encode(_ENCODING, _ERRORS)
+        offset = self._length
+        for position in range(len(self._slots) - 1, -1, -1):
+            offset -= self._counts[position]
+            start = self._slots[position] * BLOCK_BYTES
+            found = self._map.rfind(pattern, start, start + self._counts[position] * CHAR_BYTES)
+            while found != -1 and (found - start) % CHAR_BYTES:
+                found = self._map.rfind(pattern, start, found + CHAR_BYTES - 1)
+            if found != -1:
+                return offset + (found - start) // CHAR_BYTES
+        return -1
+
+    def clear(self) -> None:
+        self._mark_editing()
+        self._slots = array('I')
+        self._counts = array('I')
+        self._ends = array('Q')
+        self._clean = 0
+        self._length = 0
+        self._free = []
+        self._resize(0)
+
+    def extend(self, elements: 'MappedList') -> None:
+        if not isinstance(elements, MappedList):
+            raise TypeError("Can only extend with another MappedList instance.")
+        for position, count in enumerate(elements._counts[:]):
+            self._append_text(elements._block_text(position)[:count])
+
+    def flush(self) -> None:
+        if self._map is not None:
+            self._map.flush()
+        if self._temporary:
+            return
+        _write_table(self._table_path, self._slots, self._counts, _TABLE_SAVED)
+        self._saved = True
+
+    def close(self) -> None:
+        self._release()
@@ -0,0 +1,135 @@
+from common_definitions import to_characters
+from src.streaming import text_chunks
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Optional
+import os
+
+PARALLEL_THRESHOLD = 1 << 22
+CHUNKS_PER_WORKER = 4
+CHAR_BYTES = 4
+FILL_CHUNK_CHARS = 1 << 20
+_ENCODING = 'utf-32-le'
+_ERRORS = 'surrogatepass'
+
+def _check_pattern(pattern: str) -> None:
+    if not isinstance(pattern, str):
+        raise TypeError(f"Pattern must be a str. Got: {pattern!r}")
+    if not pattern:
+        raise ValueError("Pattern must not be empty.")
+
+def _scan(text: str, pattern: str, mode: str, starts: int):
+    end = starts + len(pattern) - 1
+    if mode == 'first':
+        return text.find(pattern, 0, end)
+    if mode == 'last':
+        return text.rfind(pattern, 0, end)
+    if mode == 'count' and len(pattern) == 1:
+        return text.count(pattern, 0, end)
+    positions = []
+    position = text.find(pattern, 0, end)
+    while position != -1:
+        positions.append(position)
+        position = text.find(pattern, position + 1, end)
+    return len(positions) if mode == 'count' else positions
+
+def _read(memory: shared_memory.SharedMemory, start: int, stop: int) -> str:
+    with memory.buf[start * CHAR_BYTES:stop * CHAR_BYTES] as view:
+        return str(view, _ENCODING, _ERRORS)
+
+def _search_chunk(name: str, start: int, stop: int, total: int, pattern: str, mode: str):
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        text = _read(memory, start, min(stop + len(pattern) - 1, total))
+    finally:
+        memory.close()
+    result = _scan(text, pattern, mode, stop - start)
+    if mode == 'all':
+        return [start + position for position in result]
+    if mode in ('first', 'last') and result != -1:
+        return start + result
+    return result
+
+def _filter_chunk(name: str, start: int, stop: int, table: dict) -> int:
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        data = _read(memory, start, stop).translate(table).encode(_ENCODING, _ERRORS)
+        memory.buf[start * CHAR_BYTES:start * CHAR_BYTES + len(data)] = data
+    finally:
+        memory.close()
+    return len(data) // CHAR_BYTES
+
+@contextmanager
+def _shared_text(source):
+    length = source.length()
+    memory = shared_memory.SharedMemory(create=True, size=max(1, length * CHAR_BYTES))
+    try:
+        offset = 0
+        for chunk in text_chunks(source, FILL_CHUNK_CHARS):
+            data = chunk.encode(_ENCODING, _ERRORS)
+            memory.buf[offset:offset + len(data)] = data
+            offset += len(data)
+        yield memory
+    finally:
+        memory.close()
+        memory.unlink()
+
+def _worker_count(source, workers: Optional[int]) -> int:
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return workers if source.length() >= PARALLEL_THRESHOLD else 1
+
+def _chunks(length: int, workers: int) -> list[tuple[int, int]]:
+    size = max(1, -(-length // (workers * CHUNKS_PER_WORKER)))
+    return [(start, min(start + size, length)) for start in range(0, length, size)]
+
+def _search(source, pattern: str, mode: str, workers: Optional[int]):
+    _check_pattern(pattern)
+    workers = _worker_count(source, workers)
+    if workers <= 1:
+        text = source.to_str()
+        return _scan(text, pattern, mode, len(text))
+    length = source.length()
+    chunks = _chunks(length, workers)
+    if mode == 'last':
+        chunks.reverse()
+    with _shared_text(source) as memory, ProcessPoolExecutor(workers) as executor:
+        results = executor.map(_search_chunk, *zip(*[(memory.name, start, stop, length, pattern, mode)
+                                                     for start, stop in chunks]))
+        if mode in ('first', 'last'):
+            found = next((result for result in results if result != -1), -1)
+            executor.shutdown(cancel_futures=True)
+            return found
+        if mode == 'count':
+            return sum(results)
+        return [position for positions in results for position in positions]
+
+def find(source, pattern: str, workers: Optional[int] = None) -> int:
+    return _search(source, pattern, 'first', workers)
+
+def rfind(source, pattern: str, workers: Optional[int] = None) -> int:
+    return _search(source, pattern, 'last', workers)
+
+def find_all(source, pattern: str, workers: Optional[int] = None) -> list[int]:
+    return _search(source, pattern, 'all', workers)
+
+def count(source, pattern: str, workers: Optional[int] = None) -> int:
+    return _search(source, pattern, 'count', workers)
+
+def filter_out(source, characters, workers: Optional[int] = None) -> str:
+    table = dict.fromkeys(map(ord, to_characters(characters)))
+    workers = _worker_count(source, workers)
+    if workers <= 1:
+        return source.to_str().translate(table)
+    chunks = _chunks(source.length(), workers)
+    with _shared_text(source) as memory, ProcessPoolExecutor(workers) as executor:
+        sizes = executor.map(_filter_chunk, *zip(*[(memory.name, start, stop, table) for start, stop in chunks]))
+        return ''.join(_read(memory, start, start + size) for (start, _), size in zip(chunks, sizes))
+
+def delete_all_of(target, characters, workers: Optional[int] = None) -> int:
+    kept = filter_out(target, characters, workers)
+    removed = target.length() - len(kept)
+    if removed:
+        target._apply_pieces([('n', list(kept))] if kept else [])
+    return removed
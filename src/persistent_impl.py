@@ -0,0 +1,39 @@
+from common_definitions import Character
+from src.rope_impl import RopeList
+
+class PersistentList(RopeList):
+    def __repr__(self) -> str:
+        return f"PersistentList(length={self.length()})"
+
+    def snapshot(self) -> 'PersistentList':
+        return self.clone()
+
+    def with_appended(self, element: Character) -> 'PersistentList':
+        new_list = self.clone()
+        new_list.append(element)
+        return new_list
+
+    def with_inserted(self, element: Character, index: int) -> 'PersistentList':
+        new_list = self.clone()
+        new_list.insert(element, index)
+        return new_list
+
+    def with_deleted(self, index: int) -> 'PersistentList':
+        new_list = self.clone()
+        new_list.delete(index)
+        return new_list
+
+    def with_all_deleted(self, element: Character) -> 'PersistentList':
+        new_list = self.clone()
+        new_list.deleteAll(element)
+        return new_list
+
+    def with_extended(self, elements: RopeList) -> 'PersistentList':
+        new_list = self.clone()
+        new_list.extend(elements)
+        return new_list
+
+    def with_reversed(self) -> 'PersistentList':
+        new_list = self.clone()
+        new_list.reverse()
+        return new_list
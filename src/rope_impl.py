@@ -0,0 +1,220 @@
+from common_definitions import Character, InvalidIndexError, CharacterTypeError, is_character, warn_non_character
+
+MAX_LEAF = 256
+
+class _Leaf:
+    __slots__ = ('text',)
+    height = 0
+
+    def __init__(self, text: str):
+        self.text: str = text
+
+    @property
+    def length(self) -> int:
+        return len(self.text)
+
+class _Concat:
+    __slots__ = ('left', 'right', 'length', 'height')
+
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+        self.length: int = left.length + right.length
+        self.height: int = max(left.height, right.height) + 1
+
+def _length(node) -> int:
+    return node.length if node is not None else 0
+
+def _height(node) -> int:
+    return node.height if node is not None else -1
+
+def _build(text: str):
+    if not text:
+        return None
+    if len(text) <= MAX_LEAF:
+        return _Leaf(text)
+    chunks = (len(text) + MAX_LEAF - 1) // MAX_LEAF
+    middle = (chunks // 2) * MAX_LEAF
+    return _Concat(_build(text[:middle]), _build(text[middle:]))
+
+def _balance(left, right):
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.height > right.height + 1:
+        if left.left.height >= left.right.height:
+            return _Concat(left.left, _Concat(left.right, right))
+        pivot = left.right
+        return _Concat(_Concat(left.left, pivot.left), _Concat(pivot.right, right))
+    if right.height > left.height + 1:
+        if right.right.height >= right.left.height:
+            return _Concat(_Concat(left, right.left), right.right)
+        pivot = right.left
+        return _Concat(_Concat(left, pivot.left), _Concat(pivot.right, right.right))
+    return _Concat(left, right)
+
+def _join(left, right):
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.length + right.length <= MAX_LEAF and left.height == 0 and right.height == 0:
+        return _Leaf(left.text + right.text)
+    if right.height == 0 and left.height == 1 and left.right.length + right.length <= MAX_LEAF:
+        return _Concat(left.left, _Leaf(left.right.text + right.text))
+    if left.height == 0 and right.height == 1 and left.length + right.left.length <= MAX_LEAF:
+        return _Concat(_Leaf(left.text + right.left.text), right.right)
+    if left.height > right.height + 1:
+        return _balance(left.left, _join(left.right, right))
+    if right.height > left.height + 1:
+        return _balance(_join(left, right.left), right.right)
+    return _Concat(left, right)
+
+def _insert(node, index: int, text: str):
+    if node is None:
+        return _Leaf(text)
+    if node.height == 0:
+        combined = node.text[:index] + text + node.text[index:]
+        if len(combined) <= MAX_LEAF:
+            return _Leaf(combined)
+        middle = len(combined) // 2
+        return _Concat(_Leaf(combined[:middle]), _Leaf(combined[middle:]))
+    left_length = node.left.length
+    if index <= left_length:
+        return _balance(_insert(node.left, index, text), node.right)
+    return _balance(node.left, _insert(node.right, index - left_length, text))
+
+def _delete(node, index: int):
+    if node.height == 0:
+        text = node.text
+        remaining = text[:index] + text[index + 1:]
+        return (_Leaf(remaining) if remaining else None), text[index]
+    left_length = node.left.length
+    if index < left_length:
+        left, data = _delete(node.left, index)
+        return _balance(left, node.right), data
+    right, data = _delete(node.right, index - left_length)
+    return _balance(node.left, right), data
+
+def _leaves(node, backwards: bool = False):
+    stack = [node] if node is not None else []
+    while stack:
+        current = stack.pop()
+        if current.height == 0:
+            yield current.text
+        elif backwards:
+            stack.append(current.left)
+            stack.append(current.right)
+        else:
+            stack.append(current.right)
+            stack.append(current.left)
+
+class RopeList:
+    def __init__(self, initial_data=None):
+        self._root = None
+        if initial_data:
+            if isinstance(initial_data, str):
+                self._root = _build(initial_data)
+                return
+            items = list(initial_data)
+            for item in items:
+                if not is_character(item):
+                    raise CharacterTypeError(f"Initial data must contain only characters. Found: {item}")
+            self._root = _build(''.join(items))
+
+    def __str__(self) -> str:
+        return f"[{', '.join(repr(item) for item in self._text())}]"
+
+    def __repr__(self) -> str:
+        return f"RopeList(length={self.length()}, height={_height(self._root)})"
+
+    def _text(self) -> str:
+        return ''.join(_leaves(self._root))
+
+    def length(self) -> int:
+        return _length(self._root)
+
+    def to_str(self) -> str:
+        return self._text()
+
+    def append(self, element: Character) -> None:
+        if not is_character(element):
+            raise CharacterTypeError(f"Can only append a single character string. Got: {element}")
+        self._root = _insert(self._root, self.length(), element)
+
+    def insert(self, element: Character, index: int) -> None:
+        if not is_character(element):
+            raise CharacterTypeError(f"Can only insert a single character string. Got: {element}")
+        if not (0 <= index <= self.length()):
+            raise InvalidIndexError(f"Index {index} is out of bounds for insertion (0 to {self.length()})")
+        self._root = _insert(self._root, index, element)
+
+    def delete(self, index: int) -> Character:
+        if not (0 <= index < self.length()):
+            raise InvalidIndexError(f"Index {index} is out of bounds for deletion (0 to {self.length() - 1})")
+        self._root, data = _delete(self._root, index)
+        return data
+
+    def deleteAll(self, element: Character) -> None:
+        if not is_character(element):
+            warn_non_character('deleteAll', element, "No elements will be deleted.")
+            return
+        self._root = _build(self._text().replace(element, ''))
+
+    def get(self, index: int) -> Character:
+        if not (0 <= index < self.length()):
+            raise InvalidIndexError(f"Index {index} is out of bounds (0 to {self.length() - 1})")
+        node = self._root
+        while node.height:
+            if index < node.left.length:
+                node = node.left
+            else:
+                index -= node.left.length
+                node = node.right
+        return node.text[index]
+
+    def clone(self) -> 'RopeList':
+        new_list = self.__class__()
+        new_list._root = self._root
+        return new_list
+
+    def reverse(self) -> None:
+        self._root = _build(self._text()[::-1])
+
+    def findFirst(self, element: Character) -> int:
+        if not is_character(element):
+            warn_non_character('findFirst', element, "Returning -1.")
+            return -1
+        offset = 0
+        for text in _leaves(self._root):
+            position = text.find(element)
+            if position != -1:
+                return offset + position
+            offset += len(text)
+        return -1
+
+    def findLast(self, element: Character) -> int:
+        if not is_character(element):
+            warn_non_character('findLast', element, "Returning -1.")
+            return -1
+        end = self.length()
+        for text in _leaves(self._root, backwards=True):
+            end -= len(text)
+            position = text.rfind(element)
+            if position != -1:
+                return end + position
+        return -1
+
+    def clear(self) -> None:
+        self._root = None
+
+    def extend(self, elements: 'RopeList') -> None:
+        if not isinstance(elements, RopeList):
+            raise TypeError("Can only extend with another RopeList instance.")
+        self._root = _join(self._root, elements._root)
+
+    def extend_from_str(self, text: str) -> None:
+        if not isinstance(text, str):
+            raise TypeError("Can only extend from a str instance.")
+        self._root = _join(self._root, _build(text))
@@ -0,0 +1,99 @@
+from src.streaming import text_chunks
+from typing import Optional
+import codecs
+import io
+import lzma
+import os
+import struct
+import zlib
+
+MAGIC = b'CHLS'
+FORMAT_VERSION = 1
+IO_CHUNK_CHARS = 1 << 20
+_HEADER = struct.Struct('<4sBBBxQ')
+ENCODINGS = {'utf-32': (0, 'utf-32-le'), 'utf-8': (1, 'utf-8')}
+COMPRESSIONS = {None: 0, 'zlib': 1, 'lzma': 2}
+_ENCODING_NAMES = {code: name for code, name in ENCODINGS.values()}
+_ERRORS = 'surrogatepass'
+
+def _compressor(compression: int):
+    if compression == 1:
+        return zlib.compressobj()
+    if compression == 2:
+        return lzma.LZMACompressor()
+    return None
+
+def _decompressor(compression: int):
+    if compression == 1:
+        return zlib.decompressobj()
+    if compression == 2:
+        return lzma.LZMADecompressor()
+    return None
+
+def dump(source, file, encoding: str = 'utf-32', compression: Optional[str] = None) -> None:
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Unsupported encoding {encoding!r}. Expected one of: {', '.join(ENCODINGS)}")
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unsupported compression {compression!r}. Expected one of: None, 'zlib', 'lzma'")
+    encoding_id, codec = ENCODINGS[encoding]
+    compression_id = COMPRESSIONS[compression]
+    file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, encoding_id, compression_id, source.length()))
+    compressor = _compressor(compression_id)
+    for chunk in text_chunks(source, IO_CHUNK_CHARS):
+        data = chunk.encode(codec, _ERRORS)
+        file.write(compressor.compress(data) if compressor else data)
+    if compressor:
+        file.write(compressor.flush())
+
+def load(target, file):
+    header = file.read(_HEADER.size)
+    if len(header) != _HEADER.size:
+        raise ValueError("Data is too short to contain a character list header.")
+    magic, version, encoding_id, compression_id, length = _HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"Data does not start with the character list magic {MAGIC!r}.")
+    if version != FORMAT_VERSION or encoding_id not in _ENCODING_NAMES or compression_id > 2:
+        raise ValueError(f"Unsupported character list format (version {version}, encoding {encoding_id}, "
+                         f"compression {compression_id}).")
+    decoder = codecs.getincrementaldecoder(_ENCODING_NAMES[encoding_id])(_ERRORS)
+    decompressor = _decompressor(compression_id)
+    count = 0
+    try:
+        while True:
+            data = file.read(IO_CHUNK_CHARS * 4)
+            if not data:
+                break
+            text = decoder.decode(decompressor.decompress(data) if decompressor else data)
+            target.extend_from_str(text)
+            count += len(text)
+        text = decoder.decode(b'', final=True)
+    except (zlib.error, lzma.LZMAError) as error:
+        raise ValueError(f"Corrupt compressed character data: {error}") from error
+    if decompressor and not decompressor.eof:
+        raise ValueError("Compressed character data is truncated.")
+    target.extend_from_str(text)
+    count += len(text)
+    if count != length:
+        raise ValueError(f"Character list data holds {count} characters but its header declares {length}.")
+    return target
+
+def save_to(source, destination, encoding: str = 'utf-32', compression: Optional[str] = None) -> None:
+    if isinstance(destination, (str, os.PathLike)):
+        with open(destination, 'wb') as file:
+            dump(source, file, encoding, compression)
+    else:
+        dump(source, destination, encoding, compression)
+
+def load_from(target, source):
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as file:
+            return load(target, file)
+    return load(target, source)
+
+def to_bytes(source, encoding: str = 'utf-32', compression: Optional[str] = None) -> bytes:
+    buffer = io.BytesIO()
+    dump(source, buffer, encoding, compression)
+    return buffer.getvalue()
+
+def from_bytes(target, data):
+    return load(target, io.BytesIO(data))
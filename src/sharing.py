@@ -0,0 +1,27 @@
+import threading
+import weakref
+
+_lock = threading.RLock()
+
+def release(sharers: list[int]) -> None:
+    with _lock:
+        sharers[0] -= 1
+
+def _track(owner) -> None:
+    if owner._release is None:
+        owner._release = weakref.finalize(owner, release, owner._sharers)
+
+def share(source, clone) -> None:
+    with _lock:
+        source._sharers[0] += 1
+    clone._sharers = source._sharers
+    _track(source)
+    _track(clone)
+
+def detach(owner) -> None:
+    if owner._sharers[0] > 1:
+        if owner._release is not None:
+            owner._release.detach()
+            owner._release = None
+        release(owner._sharers)
+        owner._sharers = [1]
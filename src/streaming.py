@@ -0,0 +1,65 @@
+from common_definitions import to_characters
+from itertools import islice
+import asyncio
+import codecs
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+async def _read_chunks(reader, chunk_size: int):
+    if hasattr(reader, 'read'):
+        while True:
+            chunk = await reader.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        async for chunk in reader:
+            yield chunk
+
+async def extend_from_stream(target, reader, chunk_size: int = DEFAULT_CHUNK_SIZE, encoding: str = 'utf-8') -> int:
+    if chunk_size <= 0:
+        raise ValueError(f"Chunk size must be positive. Got: {chunk_size}")
+    decoder = codecs.getincrementaldecoder(encoding)()
+    count = 0
+    async for chunk in _read_chunks(reader, chunk_size):
+        if isinstance(chunk, str):
+            text = chunk
+        elif isinstance(chunk, (bytes, bytearray, memoryview)):
+            text = decoder.decode(chunk)
+        else:
+            text = ''.join(to_characters(chunk))
+        for start in range(0, len(text), chunk_size):
+            target.extend_from_str(text[start:start + chunk_size])
+            await asyncio.sleep(0)
+        count += len(text)
+    text = decoder.decode(b'', final=True)
+    target.extend_from_str(text)
+    return count + len(text)
+
+def text_chunks(source, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    if chunk_size <= 0:
+        raise ValueError(f"Chunk size must be positive. Got: {chunk_size}")
+    items = iter(source.clone())
+    while True:
+        chunk = ''.join(islice(items, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+async def iter_chunks(source, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    for chunk in text_chunks(source, chunk_size):
+        yield chunk
+        await asyncio.sleep(0)
+
+async def write_to_stream(source, writer, chunk_size: int = DEFAULT_CHUNK_SIZE, encoding: str = 'utf-8') -> int:
+    encoder = codecs.getincrementalencoder(encoding)()
+    count = 0
+    async for chunk in iter_chunks(source, chunk_size):
+        writer.write(encoder.encode(chunk))
+        await writer.drain()
+        count += len(chunk)
+    tail = encoder.encode('', final=True)
+    if tail:
+        writer.write(tail)
+        await writer.drain()
+    return count
@@ -0,0 +1,231 @@
+from common_definitions import Character, InvalidIndexError, CharacterTypeError, is_character, warn_non_character
+from typing import Optional
+
+BLOCK_CAPACITY = 64
+
+class Block:
+    __slots__ = ('data', 'next', 'prev')
+
+    def __init__(self, data: list = None, next_block: 'Block' = None, prev_block: 'Block' = None):
+        self.data: list[Character] = data if data is not None else []
+        self.next: Block | None = next_block
+        self.prev: Block | None = prev_block
+
+    def __repr__(self):
+        return f"Block(data={self.data!r})"
+
+class UnrolledLinkedList:
+    def __init__(self, initial_data=None):
+        self._head: Block | None = None
+        self._tail: Block | None = None
+        self._length: int = 0
+        if initial_data:
+            items = list(initial_data)
+            for item in items:
+                if not is_character(item):
+                    raise CharacterTypeError(f"Initial data must contain only characters. Found: {item}")
+            self._append_items(items)
+
+    def __str__(self) -> str:
+        items = []
+        current = self._head
+        while current:
+            items.extend(repr(item) for item in current.data)
+            current = current.next
+        return f"[{', '.join(items)}]"
+
+    def __repr__(self) -> str:
+        return f"UnrolledLinkedList(length={self._length})"
+
+    def length(self) -> int:
+        return self._length
+
+    def to_str(self) -> str:
+        parts = []
+        current = self._head
+        while current:
+            parts.append(''.join(current.data))
+            current = current.next
+        return ''.join(parts)
+
+    def _link_after(self, block: Optional[Block], new_block: Block) -> None:
+        if block is None:
+            new_block.next = self._head
+            if self._head:
+                self._head.prev = new_block
+            self._head = new_block
+            if not self._tail:
+                self._tail = new_block
+            return
+        new_block.prev = block
+        new_block.next = block.next
+        if block.next:
+            block.next.prev = new_block
+        else:
+            self._tail = new_block
+        block.next = new_block
+
+    def _unlink(self, block: Block) -> None:
+        if block.prev:
+            block.prev.next = block.next
+        else:
+            self._head = block.next
+        if block.next:
+            block.next.prev = block.prev
+        else:
+            self._tail = block.prev
+        block.next = None
+        block.prev = None
+
+    def _append_items(self, items: list) -> None:
+        for start in range(0, len(items), BLOCK_CAPACITY):
+            self._link_after(self._tail, Block(items[start:start + BLOCK_CAPACITY]))
+        self._length += len(items)
+
+    def _locate(self, index: int) -> tuple[Block, int]:
+        if not (0 <= index < self._length):
+            raise InvalidIndexError(f"Index {index} is out of bounds (0 to {self._length - 1})")
+        if index < self._length // 2:
+            current = self._head
+            while index >= len(current.data):
+                index -= len(current.data)
+                current = current.next
+            return current, index
+        current = self._tail
+        remaining = self._length - 1 - index
+        while remaining >= len(current.data):
+            remaining -= len(current.data)
+            current = current.prev
+        return current, len(current.data) - 1 - remaining
+
+    def _merge_small(self, block: Block) -> None:
+        if len(block.data) >= BLOCK_CAPACITY // 4:
+            return
+        if block.next and len(block.data) + len(block.next.data) <= BLOCK_CAPACITY:
+            block.data.extend(block.next.data)
+            self._unlink(block.next)
+        elif block.prev and len(block.data) + len(block.prev.data) <= BLOCK_CAPACITY:
+            block.prev.data.extend(block.data)
+            self._unlink(block)
+
+    def append(self, element: Character) -> None:
+        if not is_character(element):
+            raise CharacterTypeError(f"Can only append a single character string. Got: {element}")
+        if not self._tail or len(self._tail.data) >= BLOCK_CAPACITY:
+            self._link_after(self._tail, Block())
+        self._tail.data.append(element)
+        self._length += 1
+
+    def insert(self, element: Character, index: int) -> None:
+        if not is_character(element):
+            raise CharacterTypeError(f"Can only insert a single character string. Got: {element}")
+        if not (0 <= index <= self._length):
+            raise InvalidIndexError(f"Index {index} is out of bounds for insertion (0 to {self._length})")
+        if index == self._length:
+            self.append(element)
+            return
+        block, offset = self._locate(index)
+        if len(block.data) >= BLOCK_CAPACITY:
+            half = len(block.data) // 2
+            self._link_after(block, Block(block.data[half:]))
+            del block.data[half:]
+            if offset > half:
+                block = block.next
+                offset -= half
+        block.data.insert(offset, element)
+        self._length += 1
+
+    def delete(self, index: int) -> Character:
+        if not (0 <= index < self._length):
+            raise InvalidIndexError(f"Index {index} is out of bounds for deletion (0 to {self._length - 1})")
+        block, offset = self._locate(index)
+        data = block.data.pop(offset)
+        self._length -= 1
+        if not block.data:
+            self._unlink(block)
+        else:
+            self._merge_small(block)
+        return data
+
+    def deleteAll(self, element: Character) -> None:
+        if not is_character(element):
+            warn_non_character('deleteAll', element, "No elements will be deleted.")
+            return
+        items = []
+        current = self._head
+        while current:
+            items.extend(item for item in current.data if item != element)
+            current = current.next
+        self.clear()
+        self._append_items(items)
+
+    def get(self, index: int) -> Character:
+        block, offset = self._locate(index)
+        return block.data[offset]
+
+    def clone(self) -> 'UnrolledLinkedList':
+        new_list = UnrolledLinkedList()
+        current = self._head
+        while current:
+            new_list._link_after(new_list._tail, Block(current.data[:]))
+            current = current.next
+        new_list._length = self._length
+        return new_list
+
+    def reverse(self) -> None:
+        current = self._head
+        while current:
+            next_block = current.next
+            current.next = current.prev
+            current.prev = next_block
+            current.data.reverse()
+            current = next_block
+        self._head, self._tail = self._tail, self._head
+
+    def findFirst(self, element: Character) -> int:
+        if not is_character(element):
+            warn_non_character('findFirst', element, "Returning -1.")
+            return -1
+        current = self._head
+        offset = 0
+        while current:
+            if element in current.data:
+                return offset + current.data.index(element)
+            offset += len(current.data)
+            current = current.next
+        return -1
+
+    def findLast(self, element: Character) -> int:
+        if not is_character(element):
+            warn_non_character('findLast', element, "Returning -1.")
+            return -1
+        current = self._tail
+        end = self._length
+        while current:
+            end -= len(current.data)
+            if element in current.data:
+                return end + ''.join(current.data).rfind(element)
+            current = current.prev
+        return -1
+
+    def clear(self) -> None:
+        self._head = None
+        self._tail = None
+        self._length = 0
+
+    def extend(self, elements: 'UnrolledLinkedList') -> None:
+        if not isinstance(elements, UnrolledLinkedList):
+            raise TypeError("Can only extend with another UnrolledLinkedList instance.")
+        blocks = []
+        current = elements._head
+        while current:
+            blocks.append(current.data[:])
+            current = current.next
+        for data in blocks:
+            self._link_after(self._tail, Block(data))
+        self._length += elements._length
+
+    def extend_from_str(self, text: str) -> None:
+        if not isinstance(text, str):
+            raise TypeError("Can only extend from a str instance.")
+        self._append_items(list(text))
@@ -0,0 +1,39 @@
+import sys
+import os
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import json
+
+from benchmarks import run_benchmarks
+
+def test_runner_writes_machine_readable_results(tmp_path):
+    output = tmp_path / "results.json"
+    exit_code = run_benchmarks.main(["--sizes", "10", "--ops", "5", "--output", str(output)])
+    assert exit_code == 0
+    report = json.loads(output.read_text())
+    expected = sum(run_benchmarks.supports(list_type, case) for list_type in run_benchmarks.BACKENDS.values()
+                   for case in run_benchmarks.CASES)
+    assert len(report["results"]) == expected
+    assert all(row["peak_bytes"] is not None for row in report["results"])
+    rows = {(row["backend"], row["case"]): row for row in report["results"]}
+    assert rows[("ListBasedList", "sequential_get")]["ops"] == 5
+    assert rows[("DoublyLinkedList", "splice")]["ops"] == 5
+    assert ("ArrayBasedList", "splice") not in rows
+
+    exit_code = run_benchmarks.main(["--sizes", "3", "--ops", "50", "--cases", "sequential_get", "delete",
+                                     "--backends", "ListBasedList", "--no-memory", "--output", str(tmp_path / "counts.json")])
+    assert exit_code == 0
+    counts = {row["case"]: row["ops"] for row in json.loads((tmp_path / "counts.json").read_text())["results"]}
+    assert counts == {"sequential_get": 3, "delete": 2}
+
+    exit_code = run_benchmarks.main(["--sizes", "0", "--ops", "5", "--cases", "get", "delete",
+                                     "--backends", "ListBasedList", "--no-memory", "--output", str(tmp_path / "empty.json")])
+    assert exit_code == 0
+    counts = {row["case"]: row["ops"] for row in json.loads((tmp_path / "empty.json").read_text())["results"]}
+    assert counts == {"get": 0, "delete": 0}
+
+    exit_code = run_benchmarks.main(["--sizes", "10", "--ops", "5", "--no-memory", "--output",
+                                     str(tmp_path / "again.json"), "--compare", str(output), "--threshold", "1000"])
+    assert exit_code == 0
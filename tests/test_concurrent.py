@@ -0,0 +1,165 @@
+import sys
+import os
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import random
+import threading
+import time
+
+import pytest
+
+from common_definitions import InvalidIndexError
+from list_based_impl import ListBasedList
+from src.doubly_linked_impl import DoublyLinkedList
+from src.array_based_impl import ArrayBasedList
+from src.gap_buffer_impl import GapBufferList
+from src.rope_impl import RopeList
+from src.unrolled_linked_impl import UnrolledLinkedList
+from src.concurrent_impl import ConcurrentList, ReadWriteLock
+
+WRITER_OPERATIONS = 300
+READER_THREADS = 3
+DEADLINE_SECONDS = 20
+
+def _items(chars):
+    return [chars.get(index) for index in range(chars.length())]
+
+def _check_sorted(items, errors):
+    if any(items[i] > items[i + 1] for i in range(len(items) - 1)):
+        errors.append(f"unsorted snapshot: {''.join(items)}")
+
+def _check_links(snapshot, errors):
+    if isinstance(snapshot, DoublyLinkedList):
+        forward = list(snapshot._walk())
+        backward = list(snapshot._walk(backwards=True))
+        if forward != backward[::-1] or len(forward) != snapshot.length():
+            errors.append("broken node chain")
+
+def _sorted_position(inner, element):
+    low, high = 0, inner.length()
+    while low < high:
+        middle = (low + high) // 2
+        if inner.get(middle) <= element:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+@pytest.mark.parametrize("list_type", [ListBasedList, DoublyLinkedList, ArrayBasedList, GapBufferList, RopeList,
+                                       UnrolledLinkedList])
+def test_single_writer_many_readers_never_see_corruption(list_type):
+    shared = ConcurrentList(''.join(sorted('bdfh' * 25)), list_type=list_type)
+    deadline = time.monotonic() + DEADLINE_SECONDS
+    stop = threading.Event()
+    errors = []
+
+    def writer():
+        rng = random.Random(1)
+        for _ in range(WRITER_OPERATIONS):
+            if time.monotonic() > deadline:
+                break
+            with shared.writing() as inner:
+                if rng.random() < 0.5 or inner.length() < 10:
+                    element = rng.choice('abcdefghij')
+                    inner.insert(element, _sorted_position(inner, element))
+                else:
+                    inner.delete(rng.randrange(inner.length()))
+        stop.set()
+
+    def reader(seed):
+        rng = random.Random(seed)
+        while not stop.is_set() and time.monotonic() < deadline:
+            snapshot = shared.snapshot()
+            _check_sorted(_items(snapshot), errors)
+            _check_links(snapshot, errors)
+            snapshot.append('~')
+            snapshot.delete(0)
+            _check_sorted(_items(snapshot), errors)
+            with shared.reading() as inner:
+                length = shared.length()
+                _check_sorted([inner.get(i) for i in range(0, length, max(1, length // 8))], errors)
+            if shared.findFirst('~') != -1:
+                errors.append("snapshot edit leaked into the shared list")
+            try:
+                shared.get(rng.randrange(max(1, shared.length())))
+            except InvalidIndexError:
+                pass
+
+    threads = [threading.Thread(target=reader, args=(seed,), daemon=True) for seed in range(READER_THREADS)]
+    threads.append(threading.Thread(target=writer, daemon=True))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=max(0.0, deadline - time.monotonic()) + 1)
+    assert not any(thread.is_alive() for thread in threads)
+    assert errors == []
+    _check_sorted(list(shared), errors)
+    assert errors == []
+
+def test_many_writers_keep_every_update():
+    shared = ConcurrentList(list_type=DoublyLinkedList)
+
+    def writer(element):
+        for _ in range(200):
+            shared.append(element)
+            shared.insert(element, 0)
+
+    threads = [threading.Thread(target=writer, args=(element,), daemon=True) for element in 'abcd']
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=DEADLINE_SECONDS)
+    assert not any(thread.is_alive() for thread in threads)
+    assert shared.length() == 1600
+    for element in 'abcd':
+        assert sum(1 for item in shared if item == element) == 400
+
+def test_snapshot_is_isolated_from_later_writes():
+    shared = ConcurrentList('abc', list_type=DoublyLinkedList)
+    snapshot = shared.snapshot()
+    shared.append('d')
+    shared.reverse()
+    assert str(snapshot) == "['a', 'b', 'c']"
+    assert str(shared) == "['d', 'c', 'b', 'a']"
+    clone = shared.clone()
+    clone.delete(0)
+    assert shared.length() == 4
+    assert 'c' in shared and 'x' not in shared and 'cc' not in shared
+
+def test_write_lock_excludes_readers():
+    lock = ReadWriteLock()
+    state = []
+    lock.acquire_write()
+    reader = threading.Thread(target=lambda: (lock.acquire_read(), state.append('read'), lock.release_read()),
+                              daemon=True)
+    reader.start()
+    reader.join(timeout=0.2)
+    assert state == []
+    lock.release_write()
+    reader.join(timeout=5)
+    assert state == ['read']
+
+def test_nested_reads_do_not_deadlock_behind_a_waiting_writer():
+    shared = ConcurrentList('abc', list_type=RopeList)
+    results = []
+    with shared.reading() as inner:
+        writer = threading.Thread(target=shared.append, args=('d',), daemon=True)
+        writer.start()
+        while not shared._lock._waiting_writers:
+            time.sleep(0.001)
+        results.append(shared.length())
+        results.append(str(shared.snapshot()))
+        results.append(list(shared))
+        with pytest.raises(RuntimeError):
+            shared.append('x')
+        assert inner.length() == 3
+    writer.join(timeout=5)
+    assert results == [3, "['a', 'b', 'c']", ['a', 'b', 'c']]
+    assert str(shared) == "['a', 'b', 'c', 'd']"
+    with shared.writing() as inner:
+        inner.append('e')
+        assert shared.length() == 5
+        shared.append('f')
+    assert shared.length() == 6
@@ -4,18 +4,37 @@ import os
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
+import asyncio
+import gc
+import random
+import subprocess
+
 import pytest
 
-from common_definitions import Character, InvalidIndexError, CharacterTypeError, is_character
+import common_definitions
+from common_definitions import Character, InvalidIndexError, CharacterTypeError, CharacterWarning, is_character
 from list_based_impl import ListBasedList
 from src.doubly_linked_impl import DoublyLinkedList
+from src.array_based_impl import ArrayBasedList
+from src.gap_buffer_impl import GapBufferList
+from src.rope_impl import RopeList
+from src.unrolled_linked_impl import UnrolledLinkedList, BLOCK_CAPACITY
+from src.persistent_impl import PersistentList
+from src.concurrent_impl import ConcurrentList
+from src.mmap_impl import MappedList, BLOCK_CHARS
+from src.adaptive_impl import AdaptiveList, WINDOW
+from src import parallel, char_index
+from src.instrumentation import instrument
 
-@pytest.fixture(params=[ListBasedList, DoublyLinkedList])
+LIST_TYPES = [ListBasedList, DoublyLinkedList, ArrayBasedList, GapBufferList, RopeList, UnrolledLinkedList,
+              PersistentList, ConcurrentList, MappedList, AdaptiveList]
+
+@pytest.fixture(params=LIST_TYPES)
 def empty_char_list(request):
     list_type = request.param
     return list_type()
 
-@pytest.fixture(params=[ListBasedList, DoublyLinkedList])
+@pytest.fixture(params=LIST_TYPES)
 def populated_char_list(request):
     list_type = request.param
     initial_data = ['A', 'B', 'C', 'A', 'D', 'B']
@@ -268,4 +287,847 @@ def test_initialization_with_invalid_data(empty_char_list):
         list_type(['A', 'B', 123, 'D'])
 
     with pytest.raises(CharacterTypeError):
-        list_type(['A', "TooLong", 'C'])
\ No newline at end of file
+        list_type(['A', "TooLong", 'C'])
+
+def test_random_edits_match_builtin_list(empty_char_list):
+    rng = random.Random(42)
+    expected = []
+    cursor = 0
+    for _ in range(2000):
+        operation = rng.random()
+        if operation < 0.45:
+            cursor = min(max(0, cursor + rng.randint(-3, 3)), len(expected))
+            element = rng.choice('abcdef')
+            empty_char_list.insert(element, cursor)
+            expected.insert(cursor, element)
+        elif operation < 0.8 and expected:
+            cursor = min(max(0, cursor + rng.randint(-3, 3)), len(expected) - 1)
+            assert empty_char_list.delete(cursor) == expected.pop(cursor)
+        elif operation < 0.9:
+            element = rng.choice('abcdef')
+            empty_char_list.append(element)
+            expected.append(element)
+        elif expected:
+            index = rng.randrange(len(expected))
+            assert empty_char_list.get(index) == expected[index]
+    assert empty_char_list.length() == len(expected)
+    assert str(empty_char_list) == str(expected)
+    for element in 'abcdefz':
+        expected_first = expected.index(element) if element in expected else -1
+        expected_last = len(expected) - 1 - expected[::-1].index(element) if element in expected else -1
+        assert empty_char_list.findFirst(element) == expected_first
+        assert empty_char_list.findLast(element) == expected_last
+
+def test_non_bmp_characters(empty_char_list):
+    empty_char_list.append('\U0001F600')
+    empty_char_list.insert('a', 0)
+    empty_char_list.append('\U0001F600')
+    assert empty_char_list.get(1) == '\U0001F600'
+    assert empty_char_list.findFirst('\U0001F600') == 1
+    assert empty_char_list.findLast('\U0001F600') == 2
+    empty_char_list.deleteAll('\U0001F600')
+    assert str(empty_char_list) == "['a']"
+
+    surrogates = empty_char_list.__class__('x\ud800')
+    surrogates.append('\ud800')
+    surrogates.insert('\udfff', 0)
+    assert str(surrogates) == "['\\udfff', 'x', '\\ud800', '\\ud800']"
+    assert repr(surrogates)
+    assert surrogates.findFirst('\ud800') == 2
+    assert surrogates.findLast('\ud800') == 3
+    surrogates.deleteAll('\ud800')
+    assert surrogates.get(0) == '\udfff'
+    assert surrogates.length() == 2
+
+def test_rope_extend_shares_structure_and_stays_balanced():
+    rope = RopeList('ab' * 500)
+    for _ in range(10):
+        rope.extend(rope)
+    assert rope.length() == 1000 * 2 ** 10
+    assert rope.get(rope.length() - 1) == 'b'
+    assert rope._root.height < 40
+
+    snapshot = rope.clone()
+    rope.insert('Z', 12345)
+    rope.delete(0)
+    assert snapshot.get(0) == 'a'
+    assert snapshot.findFirst('Z') == -1
+    assert rope.findFirst('Z') == 12344
+
+def test_unrolled_blocks_split_and_merge():
+    unrolled = UnrolledLinkedList('a' * (BLOCK_CAPACITY * 4))
+    for _ in range(BLOCK_CAPACITY):
+        unrolled.insert('b', BLOCK_CAPACITY)
+    assert all(len(block.data) <= BLOCK_CAPACITY for block in _blocks(unrolled))
+    while unrolled.length() > BLOCK_CAPACITY // 2:
+        unrolled.delete(unrolled.length() // 2)
+    assert len(_blocks(unrolled)) <= 2
+    assert unrolled.length() == BLOCK_CAPACITY // 2
+
+def _blocks(unrolled):
+    blocks = []
+    current = unrolled._head
+    while current:
+        blocks.append(current)
+        current = current.next
+    return blocks
+
+@pytest.fixture(params=[ListBasedList, DoublyLinkedList])
+def bulk_char_list(request):
+    return request.param('ABCDEF')
+
+def test_bulk_construction(bulk_char_list):
+    list_type = bulk_char_list.__class__
+    assert str(bulk_char_list) == "['A', 'B', 'C', 'D', 'E', 'F']"
+    assert str(list_type(b'xy')) == "['x', 'y']"
+    assert list_type('é'.encode()).to_str() == 'é'
+    assert ''.join(common_definitions.to_characters(b'\xe9', encoding='latin-1')) == 'é'
+    with pytest.raises(ValueError):
+        list_type(b'\xff')
+    assert str(list_type(iter(['p', 'q']))) == "['p', 'q']"
+    with pytest.raises(CharacterTypeError):
+        list_type(['A', 'BC'])
+
+def test_extend_from_str(bulk_char_list):
+    bulk_char_list.extend_from_str('XYZ')
+    assert bulk_char_list.length() == 9
+    assert bulk_char_list.get(8) == 'Z'
+    bulk_char_list.extend_from_str('')
+    assert bulk_char_list.length() == 9
+    with pytest.raises(TypeError):
+        bulk_char_list.extend_from_str(['X'])
+
+def test_insert_many(bulk_char_list):
+    bulk_char_list.insert_many(2, 'xy')
+    assert str(bulk_char_list) == "['A', 'B', 'x', 'y', 'C', 'D', 'E', 'F']"
+    bulk_char_list.insert_many(0, ['s'])
+    bulk_char_list.insert_many(bulk_char_list.length(), 'e')
+    assert str(bulk_char_list) == "['s', 'A', 'B', 'x', 'y', 'C', 'D', 'E', 'F', 'e']"
+    with pytest.raises(InvalidIndexError):
+        bulk_char_list.insert_many(11, 'z')
+    with pytest.raises(CharacterTypeError):
+        bulk_char_list.insert_many(0, ['z', 1])
+    assert bulk_char_list.length() == 10
+
+def test_delete_range(bulk_char_list):
+    bulk_char_list.delete_range(1, 3)
+    assert str(bulk_char_list) == "['A', 'D', 'E', 'F']"
+    bulk_char_list.delete_range(2, 2)
+    assert bulk_char_list.length() == 4
+    bulk_char_list.delete_range(2, 4)
+    assert str(bulk_char_list) == "['A', 'D']"
+    bulk_char_list.delete_range(0, 2)
+    assert str(bulk_char_list) == "[]"
+    bulk_char_list.append('Q')
+    assert bulk_char_list.get(0) == 'Q'
+    with pytest.raises(InvalidIndexError):
+        bulk_char_list.delete_range(1, 0)
+    with pytest.raises(InvalidIndexError):
+        bulk_char_list.delete_range(0, 2)
+
+def test_splice_moves_nodes_and_empties_donor():
+    target = DoublyLinkedList('AB')
+    donor = DoublyLinkedList('CD')
+    target.splice(donor)
+    assert str(target) == "['A', 'B', 'C', 'D']"
+    assert donor.length() == 0
+    assert str(donor) == "[]"
+    target.splice(donor)
+    assert target.length() == 4
+
+    empty = DoublyLinkedList()
+    empty.splice(target)
+    assert str(empty) == "['A', 'B', 'C', 'D']"
+    empty.append('E')
+    empty.reverse()
+    assert str(empty) == "['E', 'D', 'C', 'B', 'A']"
+
+    with pytest.raises(ValueError):
+        empty.splice(empty)
+    with pytest.raises(TypeError):
+        empty.splice(ListBasedList('A'))
+
+def test_split_at():
+    original = DoublyLinkedList('ABCDEF')
+    suffix = original.split_at(4)
+    assert str(original) == "['A', 'B', 'C', 'D']"
+    assert str(suffix) == "['E', 'F']"
+    assert original.get(3) == 'D'
+    assert suffix.get(0) == 'E'
+
+    assert original.split_at(4).length() == 0
+    everything = original.split_at(0)
+    assert original.length() == 0
+    assert str(everything) == "['A', 'B', 'C', 'D']"
+    original.append('Z')
+    assert str(original) == "['Z']"
+
+    everything.splice(suffix)
+    assert str(everything) == "['A', 'B', 'C', 'D', 'E', 'F']"
+    with pytest.raises(InvalidIndexError):
+        everything.split_at(7)
+
+@pytest.mark.parametrize("list_type", [ListBasedList, DoublyLinkedList])
+def test_indexed_lookups_match_unindexed(list_type):
+    rng = random.Random(7)
+    indexed = list_type('ABCABC', indexed=True)
+    plain = list_type('ABCABC')
+    for step in range(600):
+        operation = rng.random()
+        element = rng.choice('ABCD')
+        if operation < 0.3:
+            index = rng.randint(0, plain.length())
+            indexed.insert(element, index)
+            plain.insert(element, index)
+        elif operation < 0.55 and plain.length():
+            index = rng.randrange(plain.length())
+            assert indexed.delete(index) == plain.delete(index)
+        elif operation < 0.7:
+            indexed.append(element)
+            plain.append(element)
+        elif operation < 0.75:
+            indexed.reverse()
+            plain.reverse()
+        elif operation < 0.78:
+            indexed.deleteAll(element)
+            plain.deleteAll(element)
+        elif operation < 0.8:
+            indexed.extend_from_str('DA')
+            plain.extend_from_str('DA')
+        elif operation < 0.81:
+            indexed.insert_many(0, 'BB')
+            plain.insert_many(0, 'BB')
+        for probe in 'ABCDZ':
+            assert indexed.findFirst(probe) == plain.findFirst(probe)
+            assert indexed.findLast(probe) == plain.findLast(probe)
+    assert str(indexed) == str(plain)
+
+    indexed.clear()
+    assert indexed.findFirst('A') == -1
+    indexed.set_indexed(False)
+    indexed.append('A')
+    assert indexed.findLast('A') == 0
+
+@pytest.mark.parametrize("list_type", [ListBasedList, DoublyLinkedList])
+def test_indexed_edits_do_not_rebuild(list_type, monkeypatch):
+    monkeypatch.setattr(char_index, "BLOCK_SIZE", 4)
+    rebuilds = []
+    rebuild = char_index.CharacterIndex.rebuild
+    monkeypatch.setattr(char_index.CharacterIndex, "rebuild",
+                        lambda index, items: rebuilds.append(1) or rebuild(index, items))
+    rng = random.Random(11)
+    text = ''.join(rng.choices('ABC', k=200))
+    indexed = list_type(text, indexed=True)
+    plain = list_type(text)
+    for step in range(400):
+        operation = rng.random()
+        element = rng.choice('ABCD')
+        index = rng.randint(0, plain.length())
+        if operation < 0.35:
+            indexed.insert(element, index)
+            plain.insert(element, index)
+        elif operation < 0.7 and index < plain.length():
+            assert indexed.delete(index) == plain.delete(index)
+        elif operation < 0.8:
+            indexed.insert_many(index, element * 9)
+            plain.insert_many(index, element * 9)
+        elif operation < 0.9:
+            stop = min(plain.length(), index + rng.randint(0, 12))
+            indexed.delete_range(index, stop)
+            plain.delete_range(index, stop)
+        elif operation < 0.95:
+            indexed.reverse()
+            plain.reverse()
+        else:
+            indexed.deleteAll(element)
+            plain.deleteAll(element)
+        for probe in 'ABCD':
+            assert indexed.findFirst(probe) == plain.findFirst(probe)
+            assert indexed.findLast(probe) == plain.findLast(probe)
+    assert str(indexed) == str(plain)
+    assert len(rebuilds) == 1
+
+def test_finger_survives_edits_and_reverse():
+    linked = DoublyLinkedList('ABCDEFGH')
+    assert [linked.get(i) for i in range(8)] == list('ABCDEFGH')
+    assert linked.get(4) == 'E'
+    linked.insert('x', 2)
+    assert linked.get(5) == 'E'
+    linked.delete(5)
+    assert linked.get(5) == 'F'
+    linked.reverse()
+    assert linked.get(2) == 'F'
+    assert [linked.get(i) for i in range(linked.length())] == list('HGFDCxBA')
+
+def test_cursor_editing():
+    linked = DoublyLinkedList('abcab')
+    cursor = linked.cursor()
+    while not cursor.at_end():
+        if cursor.get() == 'a':
+            cursor.insert_here('[')
+            cursor.next()
+        elif cursor.get() == 'b':
+            assert cursor.delete_here() == 'b'
+        else:
+            cursor.next()
+    assert str(linked) == "['[', 'a', 'c', '[', 'a']"
+    assert cursor.index == linked.length()
+    cursor.insert_here('!')
+    cursor.prev()
+    assert cursor.get() == '!'
+    assert linked.get(linked.length() - 1) == '!'
+    assert linked.findLast('!') == 5
+
+    start = linked.cursor(0)
+    with pytest.raises(InvalidIndexError):
+        start.prev()
+    with pytest.raises(InvalidIndexError):
+        linked.cursor(linked.length() + 1)
+    with pytest.raises(InvalidIndexError):
+        cursor.next()
+        cursor.next()
+    with pytest.raises(CharacterTypeError):
+        start.insert_here('ab')
+
+@pytest.mark.parametrize("edit", [
+    lambda linked: linked.insert('Z', 0),
+    lambda linked: linked.delete(0),
+    lambda linked: linked.reverse(),
+    lambda linked: linked.append('Z'),
+    lambda linked: linked.cursor(2).insert_here('Z'),
+])
+def test_cursor_rejects_use_after_outside_edit(edit):
+    linked = DoublyLinkedList('abcdefghijklmnop')
+    cursor = linked.cursor(8)
+    edit(linked)
+    expected = linked.to_str()
+    linked.get(8)
+    for use in (lambda: cursor.insert_here('Y'), cursor.delete_here, cursor.get, cursor.next, cursor.prev):
+        with pytest.raises(RuntimeError):
+            use()
+    assert linked.to_str() == expected
+    fresh = linked.cursor(9)
+    fresh.insert_here('Y')
+    assert linked.get(9) == 'Y' and linked.to_str() == expected[:9] + 'Y' + expected[9:]
+    assert [linked.get(index) for index in range(linked.length())] == list(linked.to_str())
+
+@pytest.mark.parametrize("list_type", [ListBasedList, DoublyLinkedList])
+def test_iteration_and_slicing(list_type):
+    chars = list_type('ABCDEF')
+    assert len(chars) == 6
+    assert list(chars) == list('ABCDEF')
+    assert list(reversed(chars)) == list('FEDCBA')
+    assert 'C' in chars
+    assert 'Z' not in chars
+    assert 12 not in chars
+    assert chars[0] == 'A'
+    assert chars[-1] == 'F'
+    with pytest.raises(InvalidIndexError):
+        chars[6]
+    with pytest.raises(InvalidIndexError):
+        chars[-7]
+
+    middle = chars[1:4]
+    assert isinstance(middle, list_type)
+    assert str(middle) == "['B', 'C', 'D']"
+    assert str(chars[::2]) == "['A', 'C', 'E']"
+    assert str(chars[::-2]) == "['F', 'D', 'B']"
+    assert str(chars[4:1:-1]) == "['E', 'D', 'C']"
+    assert chars[5:2].length() == 0
+    middle.append('Z')
+    assert chars.length() == 6
+
+    assert chars.to_str() == 'ABCDEF'
+    assert chars.to_str(2) == 'CDEF'
+    assert chars.to_str(1, 3) == 'BC'
+    assert list_type().to_str() == ''
+
+def test_persistent_versions_stay_valid():
+    base = PersistentList('ABCD')
+    appended = base.with_appended('E')
+    inserted = appended.with_inserted('x', 1)
+    deleted = inserted.with_deleted(0)
+    reversed_version = deleted.with_reversed()
+    extended = base.with_extended(reversed_version)
+    without_x = extended.with_all_deleted('x')
+
+    assert str(base) == "['A', 'B', 'C', 'D']"
+    assert str(appended) == "['A', 'B', 'C', 'D', 'E']"
+    assert str(inserted) == "['A', 'x', 'B', 'C', 'D', 'E']"
+    assert str(deleted) == "['x', 'B', 'C', 'D', 'E']"
+    assert str(reversed_version) == "['E', 'D', 'C', 'B', 'x']"
+    assert extended.length() == 9
+    assert without_x.findFirst('x') == -1
+    assert isinstance(without_x, PersistentList)
+
+    snapshot = base.snapshot()
+    base.append('Q')
+    assert snapshot.length() == 4
+    assert snapshot._root is not base._root
+    with pytest.raises(InvalidIndexError):
+        base.with_deleted(10)
+
+COPY_ON_WRITE_MUTATIONS = [
+    lambda chars: chars.append('Z'),
+    lambda chars: chars.insert('Z', 2),
+    lambda chars: chars.delete(1),
+    lambda chars: chars.deleteAll('A'),
+    lambda chars: chars.reverse(),
+    lambda chars: chars.clear(),
+    lambda chars: chars.extend(chars.__class__('XY')),
+    lambda chars: chars.extend_from_str('XY'),
+    lambda chars: chars.insert_many(1, 'XY'),
+    lambda chars: chars.delete_range(1, 3),
+]
+
+@pytest.mark.parametrize("list_type", [ListBasedList, DoublyLinkedList])
+@pytest.mark.parametrize("mutate", COPY_ON_WRITE_MUTATIONS)
+def test_clone_is_copy_on_write(list_type, mutate):
+    original = list_type('ABCAD')
+    clone = original.clone()
+    assert clone._sharers is original._sharers
+
+    mutate(clone)
+    assert str(original) == "['A', 'B', 'C', 'A', 'D']"
+
+    second = original.clone()
+    mutate(original)
+    assert str(second) == "['A', 'B', 'C', 'A', 'D']"
+    assert str(original) == str(clone)
+
+@pytest.mark.parametrize("list_type", [ListBasedList, DoublyLinkedList])
+def test_dropped_clone_releases_its_share(list_type):
+    original = list_type('ABC')
+    clone = original.clone()
+    second = clone.clone()
+    assert original._sharers[0] == 3
+    del clone
+    assert original._sharers[0] == 2
+    second.append('D')
+    assert original._sharers[0] == 1
+    storage = original._data if list_type is ListBasedList else original._head
+    original.append('E')
+    assert (original._data if list_type is ListBasedList else original._head) is storage
+    del second
+    assert original._sharers[0] == 1
+    assert str(original) == "['A', 'B', 'C', 'E']"
+
+def test_linked_clone_shares_nodes_until_cursor_edit():
+    original = DoublyLinkedList('abc')
+    clone = original.clone()
+    assert clone._head is original._head
+    cursor = clone.cursor(1)
+    cursor.insert_here('x')
+    assert cursor.get() == 'b'
+    assert cursor.delete_here() == 'b'
+    assert str(clone) == "['a', 'x', 'c']"
+    assert str(original) == "['a', 'b', 'c']"
+
+    donor = original.clone()
+    clone.splice(donor)
+    assert str(clone) == "['a', 'x', 'c', 'a', 'b', 'c']"
+    assert str(original) == "['a', 'b', 'c']"
+    suffix = original.clone().split_at(1)
+    assert str(suffix) == "['b', 'c']"
+    assert str(original) == "['a', 'b', 'c']"
+
+@pytest.mark.parametrize("list_type", [ListBasedList, DoublyLinkedList])
+@pytest.mark.parametrize("indexed", [False, True])
+def test_lazy_reverse_matches_builtin_list(list_type, indexed):
+    rng = random.Random(11)
+    chars = list_type('abcde', indexed=indexed)
+    expected = list('abcde')
+    operations = ['append', 'insert', 'delete', 'reverse', 'extend', 'extend_from_str', 'insert_many',
+                  'delete_range', 'deleteAll', 'clone']
+    for _ in range(400):
+        operation = rng.choice(operations)
+        element = rng.choice('abcdef')
+        if operation == 'append':
+            chars.append(element)
+            expected.append(element)
+        elif operation == 'insert':
+            index = rng.randint(0, len(expected))
+            chars.insert(element, index)
+            expected.insert(index, element)
+        elif operation == 'delete' and expected:
+            index = rng.randrange(len(expected))
+            assert chars.delete(index) == expected.pop(index)
+        elif operation == 'reverse':
+            chars.reverse()
+            expected.reverse()
+        elif operation == 'extend':
+            other = list_type('xyz')
+            other.reverse()
+            chars.extend(other)
+            expected.extend('zyx')
+        elif operation == 'extend_from_str':
+            chars.extend_from_str('pq')
+            expected.extend('pq')
+        elif operation == 'insert_many':
+            index = rng.randint(0, len(expected))
+            chars.insert_many(index, 'mn')
+            expected[index:index] = ['m', 'n']
+        elif operation == 'delete_range':
+            start = rng.randint(0, len(expected))
+            stop = min(len(expected), start + 2)
+            chars.delete_range(start, stop)
+            del expected[start:stop]
+        elif operation == 'deleteAll':
+            chars.deleteAll(element)
+            expected = [item for item in expected if item != element]
+        elif operation == 'clone':
+            chars = chars.clone()
+        assert chars.length() == len(expected)
+        assert list(chars) == expected
+        assert list(reversed(chars)) == expected[::-1]
+        if expected:
+            index = rng.randrange(len(expected))
+            assert chars.get(index) == expected[index]
+            assert chars[index] == expected[index]
+        assert chars.findFirst(element) == (expected.index(element) if element in expected else -1)
+        assert chars.findLast(element) == (
+            len(expected) - 1 - expected[::-1].index(element) if element in expected else -1)
+    assert str(chars) == str(expected)
+    assert chars.to_str(1, 4) == ''.join(expected[1:4])
+    assert list(chars[::2]) == expected[::2]
+
+@pytest.mark.parametrize("list_type", [ListBasedList, DoublyLinkedList])
+def test_batch_applies_rebased_operations_on_commit(list_type):
+    chars = list_type('ABCDEF')
+    chars.reverse()
+    rng = random.Random(3)
+    expected = list('FEDCBA')
+    with chars.batch() as batch:
+        for _ in range(200):
+            if rng.random() < 0.55 or not expected:
+                index = rng.randint(0, len(expected))
+                element = rng.choice('xyz')
+                batch.insert(element, index)
+                expected.insert(index, element)
+            else:
+                index = rng.randrange(len(expected))
+                assert batch.delete(index) == expected.pop(index)
+            assert batch.length() == len(expected)
+        batch.append('!')
+        expected.append('!')
+        assert batch.get(len(expected) - 1) == '!'
+        assert chars.length() == 6
+    assert list(chars) == expected
+    assert chars.findLast('!') == len(expected) - 1
+
+def test_batch_rolls_back_on_error():
+    for list_type in (ListBasedList, DoublyLinkedList):
+        chars = list_type('ABC')
+        with pytest.raises(InvalidIndexError):
+            with chars.batch() as batch:
+                batch.delete(0)
+                batch.insert('X', 1)
+                batch.delete(5)
+        assert str(chars) == "['A', 'B', 'C']"
+        with pytest.raises(CharacterTypeError):
+            with chars.batch() as batch:
+                batch.append('Y')
+                batch.insert('too long', 0)
+        assert str(chars) == "['A', 'B', 'C']"
+        with pytest.raises(RuntimeError):
+            batch.append('Z')
+
+        batch = chars.batch()
+        batch.delete(0)
+        chars.append('D')
+        with pytest.raises(RuntimeError):
+            batch.commit()
+        assert str(chars) == "['A', 'B', 'C', 'D']"
+
+        for outside_edit in (lambda: chars.reverse(), lambda: (chars.delete(2), chars.append('Z'))):
+            batch = chars.batch()
+            batch.insert('X', 1)
+            outside_edit()
+            with pytest.raises(RuntimeError):
+                batch.commit()
+            assert 'X' not in chars
+
+class _CollectingWriter:
+    def __init__(self):
+        self.data = bytearray()
+        self.drains = 0
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        self.drains += 1
+
+async def _async_chunks(chunks):
+    for chunk in chunks:
+        yield chunk
+
+def test_mapped_list_persists_and_reopens(tmp_path):
+    path = str(tmp_path / "buffer.chars")
+    text = ''.join(random.Random(4).choices('abcxyz', k=BLOCK_CHARS * 3 + 17))
+    with MappedList(text, path=path) as chars:
+        for _ in range(BLOCK_CHARS // 2):
+            chars.insert('Q', BLOCK_CHARS)
+        chars.delete(0)
+        expected = text[1:BLOCK_CHARS] + 'Q' * (BLOCK_CHARS // 2) + text[BLOCK_CHARS:]
+        assert chars.to_str() == expected
+        assert all(count <= BLOCK_CHARS for count in chars._counts)
+    with MappedList(path=path) as reopened:
+        assert reopened.length() == len(expected)
+        assert reopened.findFirst('Q') == BLOCK_CHARS - 1
+        assert reopened.findLast('Q') == BLOCK_CHARS + BLOCK_CHARS // 2 - 2
+        assert reopened.to_str(BLOCK_CHARS - 2, BLOCK_CHARS + 2) == expected[BLOCK_CHARS - 2:BLOCK_CHARS + 2]
+        reopened.deleteAll('Q')
+    assert MappedList(path=path).to_str() == text[1:]
+
+    (tmp_path / "raw.chars").write_bytes(b'abcd')
+    with pytest.raises(ValueError):
+        MappedList(path=str(tmp_path / "raw.chars"))
+
+def test_mapped_list_detects_table_stale_after_unclosed_write(tmp_path):
+    path = str(tmp_path / "crash.chars")
+    script = ("import os, sys; sys.path.insert(0, sys.argv[1]); from src.mmap_impl import MappedList; "
+              "chars = MappedList('abcdefgh', path=sys.argv[2]); chars.flush(); chars.insert('Z', 2); os._exit(0)")
+    subprocess.run([sys.executable, '-c', script, project_root, path], check=True)
+    with pytest.raises(ValueError, match="stale"):
+        MappedList(path=path)
+
+    chars = MappedList('abcdefgh', path=str(tmp_path / "dropped.chars"))
+    chars.insert('\ud800', 2)
+    del chars
+    gc.collect()
+    assert MappedList(path=str(tmp_path / "dropped.chars")).to_str() == 'ab\ud800cdefgh'
+
+@pytest.mark.parametrize("list_type", [ListBasedList, DoublyLinkedList])
+def test_stream_ingest_and_export(list_type):
+    async def scenario():
+        reader = asyncio.StreamReader()
+        reader.feed_data('héllo wörld \U0001F600!'.encode('utf-8'))
+        reader.feed_eof()
+        chars = list_type('>')
+        count = await chars.extend_from_stream(reader, chunk_size=3)
+        assert count == 14
+        assert chars.to_str() == '>héllo wörld \U0001F600!'
+
+        chars.reverse()
+        chunks = [chunk async for chunk in chars.iter_chunks(chunk_size=4)]
+        assert chunks == ['!\U0001F600 d', 'lröw', ' oll', 'éh>']
+
+        writer = _CollectingWriter()
+        assert await chars.write_to_stream(writer, chunk_size=5, encoding='utf-32-le') == 15
+        assert writer.data.decode('utf-32-le') == chars.to_str()
+        assert writer.drains == 3
+
+        writer = _CollectingWriter()
+        utf16 = list_type('abcdef')
+        assert await utf16.write_to_stream(writer, chunk_size=2, encoding='utf-16') == 6
+        assert writer.data.decode('utf-16') == 'abcdef'
+
+        await chars.extend_from_stream(_async_chunks(['ab', ['c', 'd'], b'e']))
+        assert chars.to_str(15) == 'abcde'
+        with pytest.raises(CharacterTypeError):
+            await chars.extend_from_stream(_async_chunks([['x', 'yz']]))
+        with pytest.raises(ValueError):
+            await chars.extend_from_stream(_async_chunks(['x']), chunk_size=0)
+
+    asyncio.run(scenario())
+
+@pytest.mark.parametrize("list_type", [ListBasedList, DoublyLinkedList])
+@pytest.mark.parametrize("encoding", ["utf-32", "utf-8"])
+@pytest.mark.parametrize("compression", [None, "zlib", "lzma"])
+def test_binary_round_trip(list_type, encoding, compression, tmp_path):
+    chars = list_type('plain ascii, ünïcödé, \U0001F600 and \ud800 ' * 50)
+    chars.reverse()
+    data = chars.to_bytes(encoding=encoding, compression=compression)
+    assert data[:4] == b'CHLS'
+    restored = list_type.from_bytes(data)
+    assert isinstance(restored, list_type)
+    assert restored.to_str() == chars.to_str()
+
+    path = tmp_path / "chars.bin"
+    chars.save(path, encoding=encoding, compression=compression)
+    assert list_type.load(str(path)).to_str() == chars.to_str()
+    with open(path, 'rb') as file:
+        assert list_type.load(file).length() == chars.length()
+
+def test_binary_load_rejects_bad_data():
+    data = ListBasedList('abc').to_bytes(compression='zlib')
+    for broken in (b'', b'XXXX' + data[4:], data[:-3], data[:16] + b'\x00' * 8):
+        with pytest.raises(ValueError):
+            DoublyLinkedList.from_bytes(broken)
+    with pytest.raises(ValueError):
+        ListBasedList('abc').to_bytes(encoding='utf-16')
+    with pytest.raises(ValueError):
+        ListBasedList('abc').to_bytes(compression='bz2')
+
+@pytest.mark.parametrize("list_type", [ListBasedList, DoublyLinkedList])
+@pytest.mark.parametrize("threshold", [0, parallel.PARALLEL_THRESHOLD])
+def test_parallel_search_and_filter_match_serial(list_type, threshold, monkeypatch):
+    monkeypatch.setattr(parallel, "PARALLEL_THRESHOLD", threshold)
+    text = ''.join(random.Random(5).choices('ab\u00e9\U0001F600\ud800', weights=[6, 3, 1, 1, 1], k=203))
+    chars = list_type(text[::-1])
+    chars.reverse()
+    for pattern in ('a', 'aba', '\U0001F600a', '\ud800', 'zz'):
+        expected = [i for i in range(len(text)) if text.startswith(pattern, i)]
+        assert chars.find_all(pattern, workers=2) == expected
+        assert chars.count(pattern, workers=2) == len(expected)
+        assert chars.find(pattern, workers=2) == (expected[0] if expected else -1)
+        assert chars.rfind(pattern, workers=2) == (expected[-1] if expected else -1)
+    with pytest.raises(ValueError):
+        chars.find_all('')
+    with pytest.raises(TypeError):
+        chars.count(['a'])
+
+    clone = chars.clone()
+    assert chars.delete_all_of('a\U0001F600', workers=2) == text.count('a') + text.count('\U0001F600')
+    assert chars.to_str() == text.replace('a', '').replace('\U0001F600', '')
+    assert chars.delete_all_of('xyz', workers=2) == 0
+    assert clone.to_str() == text
+    assert clone.delete_all_of(set(text), workers=2) == len(text)
+    assert clone.length() == 0 and clone.to_str() == ''
+
+def test_instrumentation_records_and_restores_methods():
+    original_append = ListBasedList.append
+    original_lookup = DoublyLinkedList._get_node_at_index
+    with instrument(ListBasedList, DoublyLinkedList, track_memory=True) as metrics:
+        assert ListBasedList.append is not original_append
+        with pytest.raises(RuntimeError):
+            instrument(ListBasedList)
+        flat = ListBasedList()
+        for _ in range(5):
+            flat.append('a')
+        with pytest.raises(CharacterTypeError):
+            flat.append('too long')
+        linked = DoublyLinkedList('x' * 100)
+        linked.get(10)
+        linked.get(12)
+        linked.get(95)
+        linked.extend_from_str('y' * 1000)
+        snapshot = metrics.snapshot()
+        text = metrics.to_prometheus()
+
+    assert ListBasedList.append is original_append
+    assert DoublyLinkedList._get_node_at_index is original_lookup
+    append_stats = snapshot['ListBasedList']['methods']['append']
+    assert append_stats['calls'] == 6
+    assert append_stats['latency_seconds']['count'] == 6
+    assert append_stats['latency_seconds']['buckets']['+Inf'] == 6
+    assert snapshot['DoublyLinkedList']['methods']['get']['calls'] == 3
+    walks = snapshot['DoublyLinkedList']['node_walk']
+    assert walks['count'] == 3 and walks['sum'] == 10 + 2 + 4
+    assert 'deleteAll' not in snapshot['ListBasedList']['methods']
+    assert snapshot['DoublyLinkedList']['methods']['extend_from_str']['allocated_bytes'] > 1000
+    assert 'charlist_calls_total{class="ListBasedList",method="append"} 6' in text
+    assert 'charlist_call_duration_seconds_bucket{class="ListBasedList",method="append",le="+Inf"} 6' in text
+    assert 'charlist_node_walk_distance_count{class="DoublyLinkedList"} 3' in text
+    assert '# TYPE charlist_allocated_bytes_total counter' in text
+
+    metrics.reset()
+    assert metrics.snapshot()['ListBasedList']['methods'] == {}
+
+def test_adaptive_list_migrates_with_the_workload():
+    text = ''.join(random.Random(6).choices('abc', k=200_000))
+    expected = list(text)
+    chars = AdaptiveList(text)
+    rng = random.Random(7)
+    assert chars.representation == 'array'
+
+    for _ in range(WINDOW * 2):
+        chars.insert('h', 0)
+        expected.insert(0, 'h')
+    assert chars.representation == 'tree'
+    for _ in range(WINDOW * 24):
+        chars.insert('h', 0)
+        expected.insert(0, 'h')
+    assert chars.representation == 'chunked'
+
+    for _ in range(WINDOW * 8):
+        index = rng.randrange(len(expected))
+        assert chars.get(index) == expected[index]
+    assert chars.representation == 'array'
+
+    for _ in range(WINDOW * 8):
+        index = rng.randrange(len(expected))
+        chars.insert('m', index)
+        expected.insert(index, 'm')
+    assert chars.representation == 'tree'
+    assert chars.migrations == 4
+    assert chars.to_str() == ''.join(expected)
+
+    for _ in range(8):
+        for index in range(WINDOW - 1):
+            chars.get(index)
+        chars.insert('x', 5)
+        expected.insert(5, 'x')
+    assert chars.representation == 'tree'
+    assert chars.to_str() == ''.join(expected)
+
+def test_adaptive_list_counts_searches_in_its_cost_model():
+    chars = AdaptiveList('abc' * 10_000)
+    for _ in range(WINDOW):
+        assert chars.findLast('z') == -1
+    assert chars.representation == 'tree'
+    chars.extend_from_str('z')
+    assert chars.findFirst('z') == 30_000 and chars.to_str().endswith('cz')
+
+@pytest.mark.parametrize("list_type", [UnrolledLinkedList, RopeList])
+def test_block_lists_export_and_extend_from_str(list_type):
+    chars = list_type('abc')
+    chars.extend_from_str('de')
+    chars.extend_from_str('')
+    assert chars.to_str() == 'abcde' and chars.length() == 5
+    with pytest.raises(TypeError):
+        chars.extend_from_str(['f'])
+
+def test_adaptive_list_stays_flat_when_small():
+    chars = AdaptiveList('ab' * 100)
+    for _ in range(WINDOW * 8):
+        chars.insert('h', 0)
+    assert chars.representation == 'array' and chars.migrations == 0
+    chars.migrate('chunked')
+    chars.reverse()
+    assert chars.to_str() == ('ba' * 100) + 'h' * WINDOW * 8
+    with pytest.raises(ValueError):
+        chars.migrate('heap')
+
+@pytest.mark.parametrize("list_type", LIST_TYPES)
+def test_non_character_warnings_are_rate_limited(list_type, monkeypatch):
+    monkeypatch.setattr(common_definitions, "_last_warnings", {})
+    chars = list_type('abc')
+
+    def probe(element):
+        return chars.findFirst(element)
+
+    with pytest.warns(CharacterWarning) as record:
+        for _ in range(5):
+            assert probe('xx') == -1
+        chars.findLast(7)
+        chars.deleteAll(None)
+        chars.findFirst('zz')
+    assert [str(warning.message).split(' ')[0] for warning in record] == ['findFirst', 'findLast', 'deleteAll',
+                                                                          'findFirst']
+    assert chars.length() == 3
+    monkeypatch.setattr(common_definitions, "WARNING_INTERVAL", 0)
+    with pytest.warns(CharacterWarning, match=r"\(4 similar warnings suppressed\)"):
+        probe('yy')
+
+@pytest.mark.parametrize("list_type", [ListBasedList, DoublyLinkedList])
+def test_trusted_construction_skips_validation(list_type, monkeypatch):
+    with pytest.raises(CharacterTypeError):
+        list_type(['a', 'bc'])
+    assert list_type(['a', 'bc'], validate=False).length() == 2
+    checked = []
+    monkeypatch.setattr(common_definitions, "is_character", lambda element: checked.append(element) or True)
+    list_type(['a', 'b'], validate=False)
+    assert checked == []
+    list_type(['a', 'b'])
+    assert checked == ['a', 'b']
+    monkeypatch.undo()
+    trusted = list_type(['a', 'b', 'c'], validate=False)
+    assert trusted.to_str() == 'abc'
+    assert list_type(b'xy', validate=False).to_str() == 'xy'
+    trusted.insert('z', 1)
+    trusted.append('q')
+    assert trusted.to_str() == 'azbcq'
+    with pytest.raises(CharacterTypeError):
+        trusted.insert('zz', 0)